@@ -23,6 +23,16 @@ _ALLOWED_VECTOR_SIMILARITY_METRICS = {
     "PEARSON",
 }
 
+# Duration literal units in microseconds, largest first
+_DURATION_UNITS_US = (
+    (86_400_000_000, "d"),
+    (3_600_000_000, "h"),
+    (60_000_000, "m"),
+    (1_000_000, "s"),
+    (1_000, "ms"),
+    (1, "us"),
+)
+
 
 # Import these at runtime to avoid circular imports
 def _get_connection_classes():
@@ -703,32 +713,18 @@ class BaseQuerySet:
             return value
 
         if isinstance(duration, datetime.timedelta):
-            total_us = int(duration.total_seconds() * 1_000_000)
+            # Integer components avoid total_seconds()'s float round-trip
+            total_us = (duration.days * 86_400 + duration.seconds) * 1_000_000 + duration.microseconds
             if total_us < 0:
                 raise ValueError("timeout duration cannot be negative")
             if total_us == 0:
                 return "0ns"
 
-            days, rem_us = divmod(total_us, 86_400_000_000)
-            hours, rem_us = divmod(rem_us, 3_600_000_000)
-            minutes, rem_us = divmod(rem_us, 60_000_000)
-            seconds, rem_us = divmod(rem_us, 1_000_000)
-            millis, rem_us = divmod(rem_us, 1_000)
-            micros = rem_us
-
             parts: List[str] = []
-            if days:
-                parts.append(f"{days}d")
-            if hours:
-                parts.append(f"{hours}h")
-            if minutes:
-                parts.append(f"{minutes}m")
-            if seconds:
-                parts.append(f"{seconds}s")
-            if millis:
-                parts.append(f"{millis}ms")
-            if micros:
-                parts.append(f"{micros}us")
+            for unit_us, unit in _DURATION_UNITS_US:
+                count, total_us = divmod(total_us, unit_us)
+                if count:
+                    parts.append(f"{count}{unit}")
             return "".join(parts) if parts else "0ns"
 
         try:
@@ -22,6 +22,7 @@ from .fields import Field, RecordIDField, ReferenceField, DictField
 from .connection import ConnectionRegistry
 from .context import get_active_connection
 from .exceptions import ValidationError
+from .record_id_utils import record_id_to_str
 from surrealdb import RecordID
 from .signals import (
     pre_init,
@@ -196,11 +197,11 @@ def _serialize_for_surreal(value: Any) -> str:
         return f"d'{iso}'"
 
     if isinstance(value, RecordID):
-        return str(value)
+        return record_id_to_str(value)
 
     if hasattr(value, "id") and hasattr(value, "_get_collection_name"):
         if isinstance(value.id, RecordID):
-            return str(value.id)
+            return record_id_to_str(value.id)
         doc_id = str(value.id)
         if ":" in doc_id:
             return doc_id
@@ -3680,7 +3681,7 @@ class Document(metaclass=DocumentMetaclass):
             else:
                 field_type = "record"
         elif isinstance(field, GeometryField):
-            field_type = "geometry"
+            field_type = field.get_surreal_type()
         elif isinstance(field, BytesField):
             field_type = "bytes"
         elif isinstance(field, RegexField):
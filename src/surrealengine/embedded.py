@@ -140,16 +140,11 @@ class EmbeddedDocument(metaclass=EmbeddedDocumentMetaclass):
             if db_field in data:
                 instance._data[field_name] = field.from_db(data[db_field])
         
-        # Handle extra fields
+        # Handle extra fields: keys not handled by a known field. The known
+        # keys are collected once instead of scanning the fields per key.
+        known = {f.name if f.db_field is None else f.db_field for f in instance._fields.values()}
         for k, v in data.items():
-             # Check if it was handled by a known field
-            is_known = False
-            for f in instance._fields.values():
-                if f.db_field == k or (f.name == k and f.db_field is None):
-                    is_known = True
-                    break
-            
-            if not is_known:
+            if k not in known:
                 instance._data[k] = v
 
         return instance
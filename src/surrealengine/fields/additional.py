@@ -8,6 +8,7 @@ except ImportError:
     BoundExcluded = None
 
 from .base import Field
+from ..exceptions import ValidationError
 
 class OptionField(Field):
     """Option field type.
@@ -19,6 +20,8 @@ class OptionField(Field):
         field_type: The field type for the value when not None
     """
 
+    __slots__ = ('field_type',)
+
     def __init__(self, field_type: Field, **kwargs: Any) -> None:
         """Initialize a new OptionField.
 
@@ -96,6 +99,8 @@ class FutureField(Field):
         computation_expression: The SurrealDB expression to compute the value
     """
 
+    __slots__ = ('_computation_expression', '_db_value')
+
     def __init__(self, computation_expression: str, **kwargs: Any) -> None:
         """Initialize a new FutureField.
 
@@ -107,6 +112,17 @@ class FutureField(Field):
         super().__init__(**kwargs)
         self.py_type = Any
 
+    @property
+    def computation_expression(self) -> str:
+        """The SurrealDB expression to compute the value."""
+        return self._computation_expression
+
+    @computation_expression.setter
+    def computation_expression(self, expression: str) -> None:
+        self._computation_expression = expression
+        # The <future> literal never depends on the value, so build it once
+        self._db_value = f"<future> {{ {expression} }}"
+
     def to_db(self, value: Any) -> str:
         """Convert to SurrealDB future syntax.
 
@@ -120,7 +136,7 @@ class FutureField(Field):
             The SurrealDB future syntax string
         """
         # For future fields, we return a special SurrealDB syntax
-        return f"<future> {{ {self.computation_expression} }}"
+        return self._db_value
 
 
 class ComputedField(Field):
@@ -181,6 +197,8 @@ class TableField(Field):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new TableField.
 
@@ -285,54 +303,51 @@ class RangeField(Field):
         if value is None:
             return None
 
-        from surrealdb import Range
         if isinstance(value, Range):
             # We can't easily validate inner types of Range without unwrapping,
             # but user likely knows what they are doing if using SDK objects.
             return value
 
         if not isinstance(value, dict):
-            from ..exceptions import ValidationError
             raise ValidationError(f"Expected dict or surrealdb.Range for field '{self.name}', got {type(value)}")
 
         # Ensure the range has min and max keys
-        if 'min' not in value and 'max' not in value:
-            from ..exceptions import ValidationError
+        has_min = 'min' in value
+        has_max = 'max' in value
+        if not has_min and not has_max:
             raise ValidationError(f"Range field '{self.name}' must have at least one of 'min' or 'max' keys")
 
+        # Validated bounds go into a copy, so the caller's dict is never
+        # modified (not even partially, when the max bound then fails)
+        result = dict(value)
+        min_val = max_val = None
+
         # Validate min value if present
-        if 'min' in value:
+        if has_min:
             try:
-                value['min'] = self.min_type.validate(value['min'])
+                min_val = result['min'] = self.min_type.validate(value['min'])
             except (TypeError, ValueError) as e:
-                from ..exceptions import ValidationError
                 raise ValidationError(f"Invalid minimum value for field '{self.name}': {str(e)}")
 
         # Validate max value if present
-        if 'max' in value:
+        if has_max:
             try:
-                value['max'] = self.max_type.validate(value['max'])
+                max_val = result['max'] = self.max_type.validate(value['max'])
             except (TypeError, ValueError) as e:
-                from ..exceptions import ValidationError
                 raise ValidationError(f"Invalid maximum value for field '{self.name}': {str(e)}")
 
-        # Ensure min <= max if both are present
-        if 'min' in value and 'max' in value:
-            min_val = value['min']
-            max_val = value['max']
-
-            # Skip comparison if either value is None
-            if min_val is not None and max_val is not None:
-                # Try to compare the values
-                try:
-                    if min_val > max_val:
-                        from ..exceptions import ValidationError
-                        raise ValidationError(f"Minimum value ({min_val}) cannot be greater than maximum value ({max_val}) for field '{self.name}'")
-                except TypeError:
-                    # If values can't be compared, just skip the check
-                    pass
+        # Ensure min <= max if both are present; a missing or None bound
+        # skips the comparison
+        if min_val is not None and max_val is not None:
+            # Try to compare the values
+            try:
+                if min_val > max_val:
+                    raise ValidationError(f"Minimum value ({min_val}) cannot be greater than maximum value ({max_val}) for field '{self.name}'")
+            except TypeError:
+                # If values can't be compared, just skip the check
+                pass
 
-        return value
+        return result
 
     def to_db(self, value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Convert Python range to database representation.
@@ -346,21 +361,23 @@ class RangeField(Field):
         if value is None:
             return None
 
+        min_val = value.get('min')
+        max_val = value.get('max')
+
+        # Convert to SDK Range if fully populated
+        if min_val is not None and max_val is not None:
+             return Range(BoundIncluded(self.min_type.to_db(min_val)), BoundIncluded(self.max_type.to_db(max_val)))
+
         result = {}
 
         # Convert min value if present
-        if 'min' in value and value['min'] is not None:
-            result['min'] = self.min_type.to_db(value['min'])
+        if min_val is not None:
+            result['min'] = self.min_type.to_db(min_val)
 
         # Convert max value if present
-        if 'max' in value and value['max'] is not None:
-            result['max'] = self.max_type.to_db(value['max'])
+        if max_val is not None:
+            result['max'] = self.max_type.to_db(max_val)
 
-        # Convert to SDK Range if fully populated
-        from surrealdb import Range
-        from surrealdb.data.types.range import BoundIncluded
-        if 'min' in result and 'max' in result:
-             return Range(BoundIncluded(result['min']), BoundIncluded(result['max']))
         # Partial ranges might just be dicts? Or we construct partial Ranges? 
         # The SDK definition seems to require both begin and end.
         # If partial, we might need to fallback to manual string syntax?
@@ -397,14 +414,16 @@ class RangeField(Field):
             return res
 
         result = {}
+        min_val = value.get('min')
+        max_val = value.get('max')
 
         # Convert min value if present
-        if 'min' in value and value['min'] is not None:
-            result['min'] = self.min_type.from_db(value['min'])
+        if min_val is not None:
+            result['min'] = self.min_type.from_db(min_val)
 
         # Convert max value if present
-        if 'max' in value and value['max'] is not None:
-            result['max'] = self.max_type.from_db(value['max'])
+        if max_val is not None:
+            result['max'] = self.max_type.from_db(max_val)
 
         return result
 
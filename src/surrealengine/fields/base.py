@@ -15,16 +15,75 @@ Key Features:
     - Signal support for field operations
     - Extensible validation system
 """
+import weakref
+from inspect import iscoroutinefunction
 from typing import Any, List, Optional, Type, TypeVar
 
 from ..signals import (
-    pre_validate, post_validate, pre_to_db, post_to_db,
-    pre_from_db, post_from_db, SIGNAL_SUPPORT
+    SIGNAL_SUPPORT,
+    post_from_db,
+    post_to_db,
+    post_validate,
+    pre_from_db,
+    pre_to_db,
+    pre_validate,
 )
 
 # Type variable for field types
 T = TypeVar('T')
 
+# pre_validate is wrapped in a SignalProxy; dispatch goes to the blinker
+# signal directly so the proxy's __getattr__ stays off the hot path
+_pre_validate_signal = getattr(pre_validate, 'signal', pre_validate)
+
+# Receivers resolved per (signal, sender class), as weak references where
+# possible. Cleared whenever a receiver is connected to or disconnected from
+# one of the field signals.
+_RECEIVER_CACHE: dict[tuple[Any, type], tuple[Any, ...]] = {}
+
+
+def _receivers(signal: Any, sender: type) -> tuple[Any, ...]:
+    """Return the cached receiver references of ``signal`` for ``sender``."""
+    try:
+        return _RECEIVER_CACHE[signal, sender]
+    except KeyError:
+        pass
+    refs = []
+    for receiver in signal.receivers_for(sender):
+        if iscoroutinefunction(receiver):
+            raise RuntimeError("Cannot send to a coroutine function.")
+        try:
+            if hasattr(receiver, '__self__') and hasattr(receiver, '__func__'):
+                refs.append(weakref.WeakMethod(receiver))
+            else:
+                refs.append(weakref.ref(receiver))
+        except TypeError:
+            # Not weak-referenceable; hold it like blinker does
+            refs.append(lambda receiver=receiver: receiver)
+    result = _RECEIVER_CACHE[signal, sender] = tuple(refs)
+    return result
+
+
+def _send(signal: Any, sender: type, field: 'Field', value: Any) -> None:
+    """Dispatch a field signal without going through ``Signal.send``.
+
+    Callers test ``signal.receivers`` first, so a signal with nothing
+    connected costs a single attribute load and no call.
+    """
+    refs = _receivers(signal, sender)
+    if not refs or signal.is_muted:
+        return
+    for ref in refs:
+        receiver = ref()
+        if receiver is not None:
+            receiver(sender, field=field, value=value)
+
+
+def _identity(value: Any) -> Any:
+    """Return ``value`` unchanged (used where a conversion is a no-op)."""
+    return value
+
+
 class Field:
     """Base class for all field types.
 
@@ -41,6 +100,12 @@ class Field:
         define_schema: Whether to define this field in the schema (even for SCHEMALESS tables)
     """
 
+    __slots__ = (
+        '__weakref__', 'analyzer', 'assertion', 'bm25', 'comment', 'db_field',
+        'default', 'define_schema', 'highlights', 'index_with', 'indexed', 'name',
+        'owner_document', 'py_type', 'required', 'search', 'unique',
+    )
+
     def __init__(self, required: bool = False, default: Any = None, db_field: Optional[str] = None,
                  define_schema: bool = False, indexed: bool = False, unique: bool = False, 
                  search: bool = False, analyzer: Optional[str] = None, index_with: Optional[List[str]] = None,
@@ -107,8 +172,8 @@ class Field:
             ValueError: Field 'field_name' is required
         """
         # Trigger pre_validate signal
-        if SIGNAL_SUPPORT:
-            pre_validate.send(self.__class__, field=self, value=value)
+        if SIGNAL_SUPPORT and _pre_validate_signal.receivers:
+            _send(_pre_validate_signal, type(self), self, value)
 
         if value is None and self.required:
             raise ValueError(f"Field '{self.name}' is required")
@@ -116,11 +181,27 @@ class Field:
         result = value
 
         # Trigger post_validate signal
-        if SIGNAL_SUPPORT:
-            post_validate.send(self.__class__, field=self, value=result)
+        if SIGNAL_SUPPORT and post_validate.receivers:
+            _send(post_validate, type(self), self, result)
 
         return result
 
+    def validate_trusted(self, value: Any) -> Any:
+        """Coerce a value that does not need to be re-validated.
+
+        Used on database read paths (``from_db``) for values that SurrealDB
+        already stored under this field's schema. Unlike :meth:`validate`, the
+        required check and the validate signals are skipped. Subclasses
+        override this only when such values still need type coercion.
+
+        Args:
+            value: The trusted value
+
+        Returns:
+            The value, coerced to this field's Python type if necessary
+        """
+        return value
+
     def to_db(self, value: Any) -> Any:
         """Convert Python value to database representation.
 
@@ -147,14 +228,14 @@ class Field:
             
         """
         # Trigger pre_to_db signal
-        if SIGNAL_SUPPORT:
-            pre_to_db.send(self.__class__, field=self, value=value)
+        if SIGNAL_SUPPORT and pre_to_db.receivers:
+            _send(pre_to_db, type(self), self, value)
 
         result = value
 
         # Trigger post_to_db signal
-        if SIGNAL_SUPPORT:
-            post_to_db.send(self.__class__, field=self, value=result)
+        if SIGNAL_SUPPORT and post_to_db.receivers:
+            _send(post_to_db, type(self), self, result)
 
         return result
 
@@ -183,17 +264,36 @@ class Field:
             
         """
         # Trigger pre_from_db signal
-        if SIGNAL_SUPPORT:
-            pre_from_db.send(self.__class__, field=self, value=value)
+        if SIGNAL_SUPPORT and pre_from_db.receivers:
+            _send(pre_from_db, type(self), self, value)
 
         result = value
 
         # Trigger post_from_db signal
-        if SIGNAL_SUPPORT:
-            post_from_db.send(self.__class__, field=self, value=result)
+        if SIGNAL_SUPPORT and post_from_db.receivers:
+            _send(post_from_db, type(self), self, result)
 
         return result
 
+    def is_identity_to_db(self) -> bool:
+        """Return True if :meth:`to_db` currently returns its argument unchanged.
+
+        That is the case when this field's class does not override
+        :meth:`to_db` and no pre/post_to_db receivers are connected. Callers
+        that convert many values with one field, such as container fields, can
+        use this to skip the per-value calls.
+        """
+        return type(self).to_db is Field.to_db and not (
+            SIGNAL_SUPPORT and (pre_to_db.receivers or post_to_db.receivers))
+
+    def is_identity_from_db(self) -> bool:
+        """Return True if :meth:`from_db` currently returns its argument unchanged.
+
+        The :meth:`from_db` counterpart of :meth:`is_identity_to_db`.
+        """
+        return type(self).from_db is Field.from_db and not (
+            SIGNAL_SUPPORT and (pre_from_db.receivers or post_from_db.receivers))
+
     def get_surreal_type(self) -> str:
         """Return the SurrealQL type name for this field.
 
@@ -269,4 +369,17 @@ class Field:
     def endswith(self, other: Any) -> Any:
         """Create a ENDSWITH query expression."""
         from ..query_expressions import Q
-        return Q(**{f"{self.name}__endswith": other})
\ No newline at end of file
+        return Q(**{f"{self.name}__endswith": other})
+
+
+def _clear_receiver_cache(signal: Any, **kwargs: Any) -> None:
+    """Drop cached receivers after a field signal's receivers change."""
+    _RECEIVER_CACHE.clear()
+
+
+if SIGNAL_SUPPORT:
+    for _signal in (_pre_validate_signal, post_validate, pre_to_db, post_to_db,
+                    pre_from_db, post_from_db):
+        _signal.receiver_connected.connect(_clear_receiver_cache, sender=_signal)
+        _signal.receiver_disconnected.connect(_clear_receiver_cache, sender=_signal)
+    del _signal
@@ -1,7 +1,54 @@
+from math import isnan as _isnan
 from typing import Any, Dict, List, Optional
-from ..utils.tracking import TrackedList, TrackedDict
 
-from .base import Field
+from ..signals import SIGNAL_SUPPORT, post_validate
+from ..utils.tracking import TrackedDict, TrackedList
+from .base import Field, _pre_validate_signal
+
+# Item types for which str(a) == str(b) exactly when a == b, so SetField can
+# deduplicate them by equality instead of by their string form
+_STR_KEYED_TYPES = frozenset({str, int})
+
+
+def _primitive_item_type(field_type: Field | None) -> type | None:
+    """Return the item type whose values ``field_type.validate`` accepts as-is.
+
+    Only plain IntField, FloatField and BooleanField instances qualify: for
+    them, validating an in-bounds item of exactly this type returns it
+    unchanged, so a list whose items all have this type can be checked as a
+    whole (see :func:`_within_bounds`) instead of item by item. Returns None
+    for every other field type.
+    """
+    from .scalar import BooleanField, FloatField, IntField
+    cls = type(field_type)
+    if cls is BooleanField:
+        return bool
+    if cls is IntField:
+        return int
+    if cls is FloatField:
+        return float
+    return None
+
+
+def _within_bounds(values: list[Any], field_type: Field) -> bool:
+    """Return True if every number in ``values`` is within the field's bounds.
+
+    Uses the C-level ``min``/``max`` builtins rather than a Python loop. NaNs
+    make ``min``/``max`` order-dependent, so float lists containing one, and
+    bounds that cannot be compared, report False and are left to the
+    per-item validation to judge.
+    """
+    lo = getattr(field_type, 'min_value', None)
+    hi = getattr(field_type, 'max_value', None)
+    if lo is None and hi is None:
+        return True
+    if type(values[0]) is float and any(map(_isnan, values)):
+        return False
+    try:
+        return (lo is None or min(values) >= lo) and (hi is None or max(values) <= hi)
+    except TypeError:
+        return False
+
 
 class ListField(Field):
     """List field type.
@@ -24,6 +71,8 @@ class ListField(Field):
         >>> embedding = ListField(FloatField())
     """
 
+    __slots__ = ('_field_type', '_item_type', '_item_validate', 'max_items', 'surreal_functions')
+
     def __init__(self, field_type: Optional[Field] = None,
                  item_type: Optional[Any] = None,
                  max_items: Optional[int] = None,
@@ -41,7 +90,7 @@ class ListField(Field):
         """
         # Resolve item_type shorthand → Field instance
         if item_type is not None and field_type is None:
-            from .scalar import FloatField, IntField, StringField, BooleanField
+            from .scalar import BooleanField, FloatField, IntField, StringField
             _PYTHON_TO_FIELD: Dict[Any, Any] = {
                 float: FloatField,
                 int: IntField,
@@ -59,6 +108,17 @@ class ListField(Field):
         super().__init__(**kwargs)
         self.py_type = list
 
+    @property
+    def field_type(self) -> Field | None:
+        return self._field_type
+
+    @field_type.setter
+    def field_type(self, field_type: Field | None) -> None:
+        # Rebind the per-item shortcuts validate() uses along with the field
+        self._field_type = field_type
+        self._item_type = _primitive_item_type(field_type)
+        self._item_validate = field_type.validate if isinstance(field_type, Field) else None
+
     def validate(self, value: Any) -> Optional[List[Any]]:
         """Validate the list value.
 
@@ -84,13 +144,23 @@ class ListField(Field):
             if self.max_items is not None and len(value) > self.max_items:
                 raise ValueError(f"List field '{self.name}' exceeds max_items limit of {self.max_items}, got {len(value)} items")
 
-            if self.field_type:
+            # Homogeneous lists of primitives pass with a C-level type scan
+            # and bounds check, unless per-item validate signals must fire.
+            # Anything that fails falls through to the loop for its error.
+            item_type = self._item_type
+            if (item_type is not None and value
+                    and not (SIGNAL_SUPPORT and (_pre_validate_signal.receivers or post_validate.receivers))
+                    and set(map(type, value)) == {item_type}
+                    and _within_bounds(value, self.field_type)):
+                return value
+
+            item_validate = self._item_validate
+            if item_validate is not None:
                 for i, item in enumerate(value):
-                    if isinstance(self.field_type, Field):
-                        try:
-                            value[i] = self.field_type.validate(item)
-                        except (TypeError, ValueError) as e:
-                            raise ValueError(f"Error validating item {i} in list field '{self.name}': {str(e)}")
+                    try:
+                        value[i] = item_validate(item)
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(f"Error validating item {i} in list field '{self.name}': {e}")
         return value
 
     def to_db(self, value: Optional[List[Any]]) -> Optional[List[Any]]:
@@ -109,8 +179,13 @@ class ListField(Field):
             The database representation of the list as a plain list
         """
         if value is not None:
-            if self.field_type:
-                return [self.field_type.to_db(item) for item in value]
+            field_type = self.field_type
+            if field_type and not field_type.is_identity_to_db():
+                # Item fields with a bulk conversion handle the whole list
+                to_db_many = getattr(field_type, 'to_db_many', None)
+                if to_db_many is not None:
+                    return to_db_many(value)
+                return [field_type.to_db(item) for item in value]
             # Coerce TrackedList (or any list subclass) to a plain list so the
             # SDK encoder handles it as a regular array.
             return list(value)
@@ -128,8 +203,12 @@ class ListField(Field):
         Returns:
             The Python representation of the list
         """
-        if value is not None and self.field_type:
-            return TrackedList([self.field_type.from_db(item) for item in value])
+        field_type = self.field_type
+        if value is not None and field_type and not field_type.is_identity_from_db():
+            from_db_many = getattr(field_type, 'from_db_many', None)
+            if from_db_many is not None:
+                return TrackedList(from_db_many(value))
+            return TrackedList([field_type.from_db(item) for item in value])
         return TrackedList(value) if value is not None else None
 
 
@@ -144,6 +223,8 @@ class DictField(Field):
         field_type: The field type for values in the dictionary
     """
 
+    __slots__ = ('_field_type', '_item_validate', 'flexible', 'schema')
+
     def __init__(self, field_type: Optional[Field] = None, 
                  schema: Optional[Dict[str, Field]] = None, 
                  flexible: bool = True, **kwargs: Any) -> None:
@@ -161,6 +242,16 @@ class DictField(Field):
         super().__init__(**kwargs)
         self.py_type = dict
 
+    @property
+    def field_type(self) -> Field | None:
+        return self._field_type
+
+    @field_type.setter
+    def field_type(self, field_type: Field | None) -> None:
+        # Rebind the per-value validate shortcut along with the field
+        self._field_type = field_type
+        self._item_validate = field_type.validate if isinstance(field_type, Field) else None
+
     def validate(self, value: Any) -> Any:
         """Validate the dictionary value.
 
@@ -192,13 +283,15 @@ class DictField(Field):
                         except (TypeError, ValueError) as e:
                             raise ValueError(f"Error validating key '{key}' in dict field '{self.name}': {str(e)}")
             # Fall back to field_type validation for all keys if no schema
-            elif self.field_type:
+            elif self._item_validate is not None:
+                item_validate = self._item_validate
                 for key, item in validated.items():
-                    if isinstance(self.field_type, Field):
-                        try:
-                            validated[key] = self.field_type.validate(item)
-                        except (TypeError, ValueError) as e:
-                            raise ValueError(f"Error validating key '{key}' in dict field '{self.name}': {str(e)}")
+                    try:
+                        # Assigning to an existing key reuses its slot, so this
+                        # is safe while iterating
+                        validated[key] = item_validate(item)
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(f"Error validating key '{key}' in dict field '{self.name}': {e}")
         
         return validated
 
@@ -215,7 +308,11 @@ class DictField(Field):
             The database representation of the dictionary
         """
         if value is not None and self.field_type and isinstance(self.field_type, Field):
-            return {key: self.field_type.to_db(item) for key, item in value.items()}
+            if self.field_type.is_identity_to_db():
+                # Plain dicts need no copy; TrackedDicts are still handed to
+                # the SDK as a plain dict
+                return value if type(value) is dict else dict(value)
+            return dict(zip(value, map(self.field_type.to_db, value.values())))
         return value
 
     def from_db(self, value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -230,8 +327,9 @@ class DictField(Field):
         Returns:
             The Python representation of the dictionary
         """
-        if value is not None and self.field_type and isinstance(self.field_type, Field):
-            return {key: self.field_type.from_db(item) for key, item in value.items()}
+        if (value is not None and self.field_type and isinstance(self.field_type, Field)
+                and not self.field_type.is_identity_from_db()):
+            return dict(zip(value, map(self.field_type.from_db, value.values())))
         return value
 
 
@@ -246,6 +344,8 @@ class SetField(ListField):
             tags = SetField(StringField())
     """
 
+    __slots__ = ('_is_set',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # SurrealDB 3.0.0 removed implicit deduplication for arrays.
@@ -270,12 +370,17 @@ class SetField(ListField):
         """
         value = super().validate(value)
         if value is not None:
+            # Items are compared by str(); for lists of plain str or int
+            # values that matches equality, so dict.fromkeys can drop the
+            # duplicates in C while keeping first occurrences in order
+            if len(set(map(type, value))) == 1 and type(value[0]) in _STR_KEYED_TYPES:
+                return list(dict.fromkeys(value))
             # Deduplicate values during validation
             deduplicated = []
             seen = set()
             for item in value:
                 # Use a string representation for comparison to handle non-hashable types
-                item_str = str(item)
+                item_str = item if type(item) is str else str(item)
                 if item_str not in seen:
                     seen.add(item_str)
                     deduplicated.append(item)
@@ -286,11 +391,31 @@ class SetField(ListField):
         """Convert Python list to database representation with deduplication.
         """
         if value is not None:
-            # Deduplicate values before sending to DB
+            # Deduplicate values before sending to DB. Hashable items are
+            # tracked in a set; unhashable ones (dicts, lists) fall back to a
+            # linear scan of the unhashable items kept so far
+            if self.field_type and not self.field_type.is_identity_to_db():
+                db_items = list(map(self.field_type.to_db, value))
+            else:
+                db_items = value if isinstance(value, (list, tuple)) else list(value)
+            # dict.fromkeys keeps the first of each equal item, in order,
+            # matching the loop below whenever every item is hashable
+            try:
+                return list(dict.fromkeys(db_items))
+            except TypeError:
+                pass
             deduplicated = []
-            for item in value:
-                db_item = self.field_type.to_db(item) if self.field_type else item
-                if db_item not in deduplicated:
-                    deduplicated.append(db_item)
+            seen = set()
+            seen_unhashable = []
+            for db_item in db_items:
+                try:
+                    if db_item in seen:
+                        continue
+                    seen.add(db_item)
+                except TypeError:
+                    if db_item in seen_unhashable:
+                        continue
+                    seen_unhashable.append(db_item)
+                deduplicated.append(db_item)
             return deduplicated
         return value
\ No newline at end of file
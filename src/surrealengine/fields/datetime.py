@@ -1,9 +1,125 @@
 import datetime
+import functools
+import re
+from collections.abc import Callable
 from typing import Any, Optional
 
+from surrealdb import Duration
 
+try:
+    from surrealdb import Datetime as _SurrealDatetime
+except ImportError:
+    _SurrealDatetime = None
 
-from .base import Field
+from .base import Field, _identity
+
+# Module-level aliases for the datetime hot paths (saves the chained
+# attribute lookups on every validate/to_db/from_db call)
+_DT = datetime.datetime
+_fromiso = datetime.datetime.fromisoformat
+_fromtimestamp = datetime.datetime.fromtimestamp
+_UTC = datetime.timezone.utc
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 string, accepting a trailing ``Z`` for UTC.
+
+    Results are cached: datetimes are immutable and bulk loads (time series,
+    activity feeds) repeat the same timestamps across rows. Call
+    ``_parse_iso.cache_clear()`` to release the cache.
+    """
+    return _fromiso(value.replace('Z', '+00:00'))
+
+
+def _strip_literal(value: str) -> str:
+    """Remove the ``d'...'`` wrapper of a SurrealQL datetime literal, if any."""
+    if value[:2] == "d'" and value[-1:] == "'":
+        return value[2:-1]
+    return value
+
+
+def _datetime_from_string(value: str) -> datetime.datetime | None:
+    """Parse an ISO string or ``d'...'`` literal read from the database."""
+    try:
+        return _parse_iso(_strip_literal(value))
+    except ValueError:
+        return None
+
+
+def _datetime_from_wrapper(value: Any) -> datetime.datetime | None:
+    """Extract the datetime from an SDK ``Datetime`` wrapper."""
+    inner = getattr(value, 'inner', None)
+    if isinstance(inner, _DT):
+        return inner
+    dt = getattr(value, 'dt', None)
+    if isinstance(dt, _DT):
+        return dt
+    # Fallback to string parsing if wrapper attributes unknown
+    return _datetime_from_string(str(value))
+
+
+def _datetime_to_db(value: datetime.datetime) -> Any:
+    """Convert a datetime to the SDK wrapper, or a ``d'...'`` literal without it.
+
+    Naive datetimes are assumed to be UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_UTC)
+    # Prefer SDK wrapper when available
+    if _SurrealDatetime is not None:
+        return _SurrealDatetime(value)
+    # Fallback to Surreal literal
+    return f"d'{value.isoformat().replace('+00:00','Z')}'"
+
+
+# DateTimeField.from_db handlers keyed by the exact type of the value
+_DT_FROM_DB: dict[type, Callable[[Any], datetime.datetime | None]] = {
+    _DT: _identity,
+    str: _datetime_from_string,
+}
+if _SurrealDatetime is not None:
+    _DT_FROM_DB[_SurrealDatetime] = _datetime_from_wrapper
+
+
+# SurrealDB duration syntax, e.g. "1h30m" or "2y3d"; units in nanoseconds
+_DURATION_RE = re.compile(r'(\d+)(ns|µs|us|ms|[smhdwy])')
+_DURATION_UNITS_NS = {
+    'ns': 1,
+    'µs': 1_000,
+    'us': 1_000,
+    'ms': 1_000_000,
+    's': 1_000_000_000,
+    'm': 60 * 1_000_000_000,
+    'h': 3_600 * 1_000_000_000,
+    'd': 86_400 * 1_000_000_000,
+    'w': 604_800 * 1_000_000_000,
+    'y': 365 * 86_400 * 1_000_000_000,  # 1 year = 365 days, as in SurrealDB
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _duration_ns(value: str) -> int:
+    """Return the length of a SurrealDB duration string in nanoseconds.
+
+    Results are cached: bulk loads tend to repeat a small set of durations.
+    Strings without any duration component are handed to ``Duration.parse``
+    so the SDK's own error is raised.
+    """
+    matches = _DURATION_RE.findall(value.lower())
+    if not matches:
+        return Duration.parse(value).elapsed
+    units = _DURATION_UNITS_NS
+    return sum(int(num) * units[unit] for num, unit in matches)
+
+
+def _parse_duration(value: str) -> Duration:
+    """Parse a SurrealDB duration string into a :class:`surrealdb.Duration`.
+
+    Uses a precompiled pattern and a unit table instead of ``Duration.parse``,
+    and accepts years on every SDK version.
+    """
+    # Duration is mutable, so only the nanosecond count is cached
+    return Duration(_duration_ns(value))
 
 class DateTimeField(Field):
     """DateTime field type.
@@ -26,6 +142,8 @@ class DateTimeField(Field):
         await event.save()
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new DateTimeField.
 
@@ -46,53 +164,47 @@ class DateTimeField(Field):
             return None
 
         # Already a datetime
-        if isinstance(value, datetime.datetime):
+        if type(value) is _DT or isinstance(value, _DT):
             return value
 
         # SDK wrapper instance provided directly
-        try:
-            from surrealdb import Datetime
-            if isinstance(value, Datetime):
-                # Assuming Datetime has a 'dt' or 'datetime' property or similar,
-                # or we can extract it. Based on SDK source, it wraps valid input.
-                # If it stores it as string internally or object, we need to extract.
-                # For now, let's assume we can trust it or it has a way to get back to datetime.
-                # If the SDK 1.0.7 Datetime object usage is opaque, we might return it as is
-                # if the expected return type was lenient, but type hint says Optional[datetime.datetime].
-                # We should try to extract the python datetime.
-                if hasattr(value, 'inner'): # Check SDK source if possible, else generic
-                    return value.inner
-                if hasattr(value, 'dt'):
-                    return value.dt
-                # Fallback: maybe it is a subclass of datetime? Unlikely.
-                # If we return it here, it breaks return type contract if it's not a datetime.
-                # Let's assume validation is satisfied if it's a Datetime, but we need to return datetime. 
-                # Let's inspect it via str and parse if needed.
-                return datetime.datetime.fromisoformat(str(value).replace("d'", "").replace("'", "").replace('Z', '+00:00'))
-        except ImportError:
-            pass
+        if _SurrealDatetime is not None and isinstance(value, _SurrealDatetime):
+            # Assuming Datetime has a 'dt' or 'datetime' property or similar,
+            # or we can extract it. Based on SDK source, it wraps valid input.
+            # If it stores it as string internally or object, we need to extract.
+            # For now, let's assume we can trust it or it has a way to get back to datetime.
+            # If the SDK 1.0.7 Datetime object usage is opaque, we might return it as is
+            # if the expected return type was lenient, but type hint says Optional[datetime.datetime].
+            # We should try to extract the python datetime.
+            if hasattr(value, 'inner'): # Check SDK source if possible, else generic
+                return value.inner
+            if hasattr(value, 'dt'):
+                return value.dt
+            # Fallback: maybe it is a subclass of datetime? Unlikely.
+            # If we return it here, it breaks return type contract if it's not a datetime.
+            # Let's assume validation is satisfied if it's a Datetime, but we need to return datetime. 
+            # Let's inspect it via str and parse if needed.
+            return _fromiso(str(value).replace("d'", "").replace("'", "").replace('Z', '+00:00'))
 
         # Epoch seconds or milliseconds
         if isinstance(value, (int, float)):
             seconds = value / 1000.0 if value >= 1_000_000_000_000 else float(value)
             try:
-                return datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+                return _fromtimestamp(seconds, tz=_UTC)
             except (OverflowError, OSError, ValueError):
                 raise TypeError(f"Numeric value for '{self.name}' is not a valid epoch timestamp")
 
         # Strings (ISO, Surreal literal, with spaces, with Z)
         if isinstance(value, str):
-            s = value.strip()
-            if s.startswith("d'") and s.endswith("'"):
-                s = s[2:-1]
-            s_norm = s.replace('Z', '+00:00')
+            s = _strip_literal(value.strip())
             try:
-                return datetime.datetime.fromisoformat(s_norm)
+                return _parse_iso(s)
             except ValueError:
                 pass
+            s_norm = s.replace('Z', '+00:00')
             if ' ' in s_norm and 'T' not in s_norm:
                 try:
-                    return datetime.datetime.fromisoformat(s_norm.replace(' ', 'T', 1))
+                    return _fromiso(s_norm.replace(' ', 'T', 1))
                 except ValueError:
                     pass
             raise TypeError(f"String value for '{self.name}' is not a valid datetime: {value!r}")
@@ -109,42 +221,36 @@ class DateTimeField(Field):
         """
         if value is None:
             return None
-        
-        try:
-            from surrealdb import Datetime
-        except ImportError:
-            Datetime = None
 
-        # Coerce from string when possible
+        # datetimes (the common case) and parsed strings go straight to the
+        # conversion without probing the other input types
+        if type(value) is _DT:
+            return _datetime_to_db(value)
+
         if isinstance(value, str):
             try:
-                # Normalize trailing Z to +00:00 for fromisoformat
-                value = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+                # Normalizes a trailing Z to +00:00 for fromisoformat
+                parsed = _parse_iso(value)
             except ValueError:
                 # Let SDK try to handle unknown string as-is (unlikely)
                 return value
-        
+            return _datetime_to_db(parsed)
+
         # Direct wrapper passthrough
-        if Datetime is not None and isinstance(value, Datetime):
+        if _SurrealDatetime is not None and isinstance(value, _SurrealDatetime):
             return value
 
         if isinstance(value, (int, float)):
             # treat as epoch seconds or milliseconds
             seconds = value / 1000.0 if value >= 1_000_000_000_000 else float(value)
             try:
-                value = datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+                value = _fromtimestamp(seconds, tz=_UTC)
             except Exception:
                 return value
-        
-        if isinstance(value, datetime.datetime):
-            # Ensure timezone-aware; default to UTC if naive
-            if value.tzinfo is None:
-                value = value.replace(tzinfo=datetime.timezone.utc)
-            # Prefer SDK wrapper when available
-            if Datetime is not None:
-                return Datetime(value)
-            # Fallback to Surreal literal
-            return f"d'{value.isoformat().replace('+00:00','Z')}'"
+            return _datetime_to_db(value)
+
+        if isinstance(value, _DT):
+            return _datetime_to_db(value)
         return value
 
     def from_db(self, value: Any) -> Optional[datetime.datetime]:
@@ -155,37 +261,18 @@ class DateTimeField(Field):
         """
         if value is None:
             return None
-        
-        try:
-            from surrealdb import Datetime
-            # SDK wrapper
-            if isinstance(value, Datetime):
-                # Try to extract the datetime object
-                if hasattr(value, 'inner') and isinstance(value.inner, datetime.datetime):
-                    return value.inner
-                if hasattr(value, 'dt') and isinstance(value.dt, datetime.datetime):
-                    return value.dt
-                # Fallback to string parsing if wrapper attributes unknown
-                s = str(value)
-                if s.startswith("d'") and s.endswith("'"):
-                    s = s[2:-1]
-                try:
-                    return datetime.datetime.fromisoformat(s.replace('Z', '+00:00'))
-                except ValueError:
-                    return None
-        except ImportError:
-            pass
-            
-        # Surreal datetime literal like d'2025-08-31T12:34:56Z'
+
+        # Exact-type dispatch covers SDK-decoded results; subclasses fall
+        # through to the isinstance checks below
+        handler = _DT_FROM_DB.get(type(value))
+        if handler is not None:
+            return handler(value)
+
+        if _SurrealDatetime is not None and isinstance(value, _SurrealDatetime):
+            return _datetime_from_wrapper(value)
         if isinstance(value, str):
-            s = value
-            if s.startswith("d'") and s.endswith("'"):
-                s = s[2:-1]
-            try:
-                return datetime.datetime.fromisoformat(s.replace('Z', '+00:00'))
-            except ValueError:
-                return None
-        if isinstance(value, datetime.datetime):
+            return _datetime_from_string(value)
+        if isinstance(value, _DT):
             return value
         return None
 
@@ -207,6 +294,8 @@ class TimeSeriesField(DateTimeField):
                 time_field = "timestamp"
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new TimeSeriesField.
 
@@ -215,19 +304,6 @@ class TimeSeriesField(DateTimeField):
         """
         super().__init__(**kwargs)
 
-    def validate(self, value: Any) -> Optional[datetime.datetime]:
-        """Validate the timestamp value.
-
-        This method checks if the value is a valid timestamp for time series data.
-
-        Args:
-            value: The value to validate
-
-        Returns:
-            The validated timestamp value
-        """
-        return super().validate(value)
-
 
 class DurationField(Field):
     """Duration field type.
@@ -236,6 +312,8 @@ class DurationField(Field):
     conversion between Python timedelta objects and SurrealDB duration strings.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new DurationField.
 
@@ -243,8 +321,6 @@ class DurationField(Field):
             **kwargs: Additional arguments to pass to the parent class
         """
         super().__init__(**kwargs)
-        super().__init__(**kwargs)
-        from surrealdb import Duration
         self.py_type = (datetime.timedelta, Duration)
 
     def validate(self, value: Any) -> Optional[datetime.timedelta]:
@@ -266,14 +342,13 @@ class DurationField(Field):
         if value is not None:
             if isinstance(value, datetime.timedelta):
                 return value
-            
-            from surrealdb import Duration
+
             if isinstance(value, Duration):
                 return value
 
             if isinstance(value, str):
                 try:
-                    return Duration.parse(value)
+                    return _parse_duration(value)
                 except ValueError:
                      # Fallback to manual parsing if SDK fails or for complex python-side logic? 
                      # Actually, SDK Duration should handle it.
@@ -282,6 +357,18 @@ class DurationField(Field):
             raise TypeError(f"Expected duration for field '{self.name}', got {type(value)}")
         return value
 
+    def validate_trusted(self, value: Any) -> Any:
+        """Parse a duration string read from the database.
+
+        Skips the required check and validate signals of :meth:`validate`.
+        """
+        if isinstance(value, str):
+            try:
+                return _parse_duration(value)
+            except ValueError:
+                raise TypeError(f"Expected duration for field '{self.name}', got {type(value)}")
+        return value
+
     def to_db(self, value: Any) -> Optional[Any]:
         """Convert Python timedelta to database representation.
 
@@ -297,40 +384,20 @@ class DurationField(Field):
         if value is None:
             return None
 
-        # Import SurrealDB Duration class
-        from surrealdb import Duration
-
         if isinstance(value, str):
-            # If it's already a string, convert to a supported format
-            self.validate(value)  # Validate first
-            # Convert years to days (approximate: 1 year = 365 days)
-            if 'y' in value:
-                # Simple conversion for basic year formats like "2y"
-                import re
-                year_match = re.search(r'(\d+)y', value)
-                if year_match:
-                    years = int(year_match.group(1))
-                    days = years * 365
-                    # Replace the year part with days
-                    converted = re.sub(r'\d+y', f'{days}d', value)
-                    return Duration.parse(converted)
-            return Duration.parse(value)
+            # Validation parses the string (years count as 365 days)
+            return self.validate(value)
 
         if isinstance(value, datetime.timedelta):
-            # Convert timedelta to Duration via string representation or let SDK handle if it supports timedelta
-            # SDK Duration(str) is standard
-            # Convert to ns for direct construction to be efficient
-            total_seconds = value.total_seconds()
-            ns = int(total_seconds * 1_000_000_000)
+            # Build nanoseconds from the timedelta's integer components; this
+            # avoids total_seconds()'s float round-trip and is exact
+            ns = ((value.days * 86_400 + value.seconds) * 1_000_000 + value.microseconds) * 1_000
             return Duration(ns)
 
         # If it's already a Duration object, return as is
         if isinstance(value, Duration):
             return value
 
-        if isinstance(value, str):
-             return Duration.parse(value)
-
         raise TypeError(f"Cannot convert {type(value)} to duration")
 
     def from_db(self, value: Any) -> Optional[datetime.timedelta]:
@@ -346,5 +413,5 @@ class DurationField(Field):
             The Python timedelta object
         """
         if value is not None and isinstance(value, str):
-            return self.validate(value)
+            return self.validate_trusted(value)
         return value
\ No newline at end of file
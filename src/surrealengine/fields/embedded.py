@@ -1,12 +1,14 @@
-from typing import Any, Optional, Type, Dict
+from typing import TYPE_CHECKING, Any, Optional
 
 from .base import Field
-from ..embedded import EmbeddedDocument
+
+if TYPE_CHECKING:
+    from ..embedded import EmbeddedDocument
 
 class EmbeddedField(Field):
     """Field for storing embedded documents."""
 
-    def __init__(self, document_type: Type[EmbeddedDocument], 
+    def __init__(self, document_type: type['EmbeddedDocument'], 
                  flexible: bool = False, **kwargs: Any) -> None:
         """Initialize a new EmbeddedField.
 
@@ -20,7 +22,7 @@ class EmbeddedField(Field):
         super().__init__(**kwargs)
         self.py_type = document_type
 
-    def validate(self, value: Any) -> Optional[EmbeddedDocument]:
+    def validate(self, value: Any) -> Optional['EmbeddedDocument']:
         """Validate the embedded document."""
         if value is None:
             if self.required:
@@ -42,7 +44,7 @@ class EmbeddedField(Field):
 
         raise TypeError(f"Expected {self.document_type.__name__} or dict for field '{self.name}', got {type(value)}")
 
-    def to_db(self, value: Optional[EmbeddedDocument]) -> Optional[Dict[str, Any]]:
+    def to_db(self, value: Optional['EmbeddedDocument']) -> dict[str, Any] | None:
         """Convert embedded document to database representation."""
         if value is not None:
             if isinstance(value, self.document_type):
@@ -54,7 +56,7 @@ class EmbeddedField(Field):
                 return value
         return value
 
-    def from_db(self, value: Any) -> Optional[EmbeddedDocument]:
+    def from_db(self, value: Any) -> Optional['EmbeddedDocument']:
         """Convert database representation to embedded document."""
         if value is None:
             return None
@@ -1,6 +1,125 @@
+from typing import Any
+
+from surrealdb import Geometry
+from surrealdb.data.types.geometry import (
+    GeometryCollection,
+    GeometryLine,
+    GeometryMultiLine,
+    GeometryMultiPoint,
+    GeometryMultiPolygon,
+    GeometryPoint,
+    GeometryPolygon,
+)
 
-from .base import Field
 from ..exceptions import ValidationError
+from .base import Field
+
+# GeoJSON type of each concrete SDK geometry class. The keys are matched by
+# exact type before the isinstance check that covers subclasses.
+_GEOMETRY_TYPES = {
+    GeometryPoint: "Point",
+    GeometryLine: "LineString",
+    GeometryPolygon: "Polygon",
+    GeometryMultiPoint: "MultiPoint",
+    GeometryMultiLine: "MultiLineString",
+    GeometryMultiPolygon: "MultiPolygon",
+    GeometryCollection: "GeometryCollection",
+}
+
+
+def _geojson_type(geometry: Any) -> str | None:
+    """Return the GeoJSON type of an SDK geometry object, or None if unknown."""
+    for cls in type(geometry).__mro__:
+        geo_type = _GEOMETRY_TYPES.get(cls)
+        if geo_type is not None:
+            return geo_type
+    return None
+
+
+def _is_point_list(points: Any) -> bool:
+    """Return True if ``points`` is a list of ``[x, y]`` lists.
+
+    Lists of plain two-item lists are recognized with C-level ``map`` scans
+    over the points; anything else (list subclasses, malformed points) is
+    decided by walking the points one by one.
+    """
+    if not isinstance(points, list):
+        return False
+    if set(map(type, points)) <= {list} and set(map(len, points)) <= {2}:
+        return True
+    return all(isinstance(point, list) and len(point) == 2 for point in points)
+
+
+def _check_rings(rings: list) -> None:
+    """Enforce closed linear rings of at least 4 positions for one polygon.
+
+    Only the first and last position of each ring are inspected, so the
+    cost grows with the number of rings rather than the number of points.
+    """
+    for ring in rings:
+        if len(ring) < 4:
+            raise ValidationError("Polygon linear ring must have at least 4 positions")
+        if ring[0] != ring[-1]:
+            raise ValidationError("Polygon linear ring must be closed (first and last positions must be identical)")
+
+
+def _check_point(coordinates: list) -> None:
+    """Check Point coordinates: a single [x, y] position."""
+    if len(coordinates) != 2:
+        raise ValidationError("Point coordinates must be a list of two numbers")
+
+
+def _check_point_list(coordinates: list) -> None:
+    """Check LineString/MultiPoint coordinates: a list of positions."""
+    if not _is_point_list(coordinates):
+        raise ValidationError("LineString/MultiPoint coordinates must be a list of [x,y] points")
+
+
+def _check_multi_line(coordinates: list) -> None:
+    """Check MultiLineString coordinates: a list of position lists."""
+    if not all(_is_point_list(line) for line in coordinates):
+        raise ValidationError("MultiLineString must be a list of coordinate arrays")
+
+
+def _check_polygon(coordinates: list) -> None:
+    """Check Polygon coordinates: closed rings of positions."""
+    if not all(_is_point_list(line) for line in coordinates):
+        raise ValidationError("Polygon must be a list of coordinate arrays")
+    _check_rings(coordinates)
+
+
+def _check_multi_polygon(coordinates: list) -> None:
+    """Check MultiPolygon coordinates: a list of polygons."""
+    if not all(isinstance(polygon, list) and
+               all(_is_point_list(line) for line in polygon)
+               for polygon in coordinates):
+        raise ValidationError("MultiPolygon must be a list of polygon arrays")
+    for polygon in coordinates:
+        _check_rings(polygon)
+
+
+# Structural checks of GeoJSON coordinates, keyed by geometry type. Types not
+# listed here are accepted without inspecting their coordinates.
+_GEOJSON_CHECKS = {
+    "Point": _check_point,
+    "LineString": _check_point_list,
+    "MultiPoint": _check_point_list,
+    "MultiLineString": _check_multi_line,
+    "Polygon": _check_polygon,
+    "MultiPolygon": _check_multi_polygon,
+}
+
+
+# SurrealQL geometry<...> subtype for each GeoJSON type
+_SURREAL_GEOMETRY_TYPES = {
+    "Point": "point",
+    "LineString": "line",
+    "Polygon": "polygon",
+    "MultiPoint": "multipoint",
+    "MultiLineString": "multiline",
+    "MultiPolygon": "multipolygon",
+}
+
 
 class GeometryField(Field):
     """Field for handling geometric data in SurrealDB.
@@ -11,30 +130,51 @@ class GeometryField(Field):
 
     Attributes:
         required (bool): Whether the field is required. Defaults to False.
+        geometry_type (str, optional): GeoJSON type every value must have
+            (e.g. ``"Polygon"``), or None to accept any geometry type.
 
     Example::
 
         class Location(Document):
             point = GeometryField()
+            area = GeometryField(geometry_type="Polygon")
 
         # Using GeometryPoint for precise coordinate handling
         from surrealengine.geometry import GeometryPoint
         loc = Location(point=GeometryPoint([-122.4194, 37.7749]))
     """
 
-    def __init__(self, required: bool = False, **kwargs):
+    __slots__ = ('_check_coordinates', 'geometry_type')
+
+    def __init__(self, required: bool = False, geometry_type: str | None = None, **kwargs):
         """Initialize a GeometryField.
 
         Args:
             required (bool, optional): Whether this field is required. Defaults to False.
+            geometry_type (str, optional): Restrict values to one GeoJSON type
+                (``"Point"``, ``"LineString"``, ``"Polygon"``, ``"MultiPoint"``,
+                ``"MultiLineString"`` or ``"MultiPolygon"``). The schema then
+                declares the matching ``geometry<...>`` type.
             **kwargs: Additional field options to be passed to the parent Field class.
+
+        Raises:
+            ValueError: If geometry_type is not a supported GeoJSON type
         """
+        if geometry_type is not None and geometry_type not in _GEOJSON_CHECKS:
+            allowed = ", ".join(_GEOJSON_CHECKS)
+            raise ValueError(f"Invalid geometry_type '{geometry_type}'. Allowed values: {allowed}.")
+        self.geometry_type = geometry_type
+        # Coordinate check for the declared type, resolved once
+        self._check_coordinates = _GEOJSON_CHECKS[geometry_type] if geometry_type else None
         super().__init__(required=required, **kwargs)
-        super().__init__(required=required, **kwargs)
-        from surrealdb import Geometry
-        from surrealdb.data.types.geometry import GeometryCollection
         self.py_type = (dict, Geometry, GeometryCollection)
 
+    def get_surreal_type(self) -> str:
+        """Return ``geometry``, narrowed to the declared geometry_type if any."""
+        if self.geometry_type:
+            return f"geometry<{_SURREAL_GEOMETRY_TYPES[self.geometry_type]}>"
+        return "geometry"
+
     def validate(self, value):
         """Validate geometry data.
 
@@ -58,11 +198,9 @@ class GeometryField(Field):
             return None
 
         # Handle SDK Geometry objects
-        from surrealdb import Geometry
-        # Try to import GeometryCollection if not available top level? 
-        # Actually standard import from submodules is better
-        from surrealdb.data.types.geometry import GeometryCollection
-        if isinstance(value, (Geometry, GeometryCollection)):
+        if type(value) in _GEOMETRY_TYPES or isinstance(value, (Geometry, GeometryCollection)):
+            if self.geometry_type is not None and _geojson_type(value) != self.geometry_type:
+                raise ValidationError(f"Geometry must be of type '{self.geometry_type}'")
             return value
 
         # Handle GeometryPoint and other Geometry objects with to_json
@@ -70,7 +208,8 @@ class GeometryField(Field):
             return value.to_json()
 
         # Handle simple coordinate arrays for Point geometry (longitude, latitude)
-        if isinstance(value, (list, tuple)) and len(value) == 2:
+        if (self.geometry_type in (None, "Point") and
+                isinstance(value, (list, tuple)) and len(value) == 2):
             try:
                 # Validate that coordinates are numeric
                 float(value[0])  # longitude
@@ -89,45 +228,14 @@ class GeometryField(Field):
             raise ValidationError("Coordinates must be a list")
 
         # Validate structure based on geometry type without modifying values
-        if value["type"] == "Point":
-            if len(value["coordinates"]) != 2:
-                raise ValidationError("Point coordinates must be a list of two numbers")
-        elif value["type"] in ("LineString", "MultiPoint"):
-            if not all(isinstance(point, list) and len(point) == 2 for point in value["coordinates"]):
-                raise ValidationError("LineString/MultiPoint coordinates must be a list of [x,y] points")
-        elif value["type"] == "MultiLineString":
-            if not all(isinstance(line, list) and
-                       all(isinstance(point, list) and len(point) == 2 for point in line)
-                       for line in value["coordinates"]):
-                raise ValidationError("MultiLineString must be a list of coordinate arrays")
-
-        elif value["type"] == "Polygon":
-            if not all(isinstance(line, list) and
-                       all(isinstance(point, list) and len(point) == 2 for point in line)
-                       for line in value["coordinates"]):
-                raise ValidationError("Polygon must be a list of coordinate arrays")
-            
-            # Enforce closed linear rings
-            for ring in value["coordinates"]:
-                if len(ring) < 4:
-                    raise ValidationError("Polygon linear ring must have at least 4 positions")
-                if ring[0] != ring[-1]:
-                    raise ValidationError("Polygon linear ring must be closed (first and last positions must be identical)")
-
-        elif value["type"] == "MultiPolygon":
-            if not all(isinstance(polygon, list) and
-                       all(isinstance(line, list) and
-                           all(isinstance(point, list) and len(point) == 2 for point in line)
-                           for line in polygon)
-                       for polygon in value["coordinates"]):
-                raise ValidationError("MultiPolygon must be a list of polygon arrays")
-            
-            # Enforce closed linear rings for all polygons
-            for polygon in value["coordinates"]:
-                for ring in polygon:
-                    if len(ring) < 4:
-                        raise ValidationError("Polygon linear ring must have at least 4 positions")
-                    if ring[0] != ring[-1]:
-                        raise ValidationError("Polygon linear ring must be closed (first and last positions must be identical)")
+        geo_type = value["type"]
+        check = self._check_coordinates
+        if check is not None:
+            if geo_type != self.geometry_type:
+                raise ValidationError(f"Geometry must be of type '{self.geometry_type}'")
+        elif isinstance(geo_type, str):
+            check = _GEOJSON_CHECKS.get(geo_type)
+        if check is not None:
+            check(value["coordinates"])
 
         return value
\ No newline at end of file
@@ -1,8 +1,10 @@
 from typing import Any, Optional
+
 from surrealdb import RecordID
 
 from .base import Field
 
+
 class RecordIDField(Field):
     """RecordID field type.
 
@@ -19,6 +21,8 @@ class RecordIDField(Field):
             target = RecordIDField()
     """
 
+    __slots__ = ('table_name',)
+
     def __init__(self, table_name: Optional[str] = None, **kwargs: Any) -> None:
         """Initialize a new RecordIDField.
 
@@ -47,13 +51,23 @@ class RecordIDField(Field):
         """
         validated = super().validate(value)
         if validated is not None:
-            if isinstance(validated, RecordID):
-                pass
-            elif isinstance(validated, str):
+            # Dispatch on the exact type first; plain str and RecordID cover
+            # nearly every value, subclasses fall through to isinstance()
+            cls = type(validated)
+            if cls is str or (cls is not RecordID and isinstance(validated, str)):
                 # Check if it's in the format "table:id"
-                if ':' not in validated:
+                colon = validated.find(':')
+                if colon == -1:
                     raise ValueError(f"Invalid record ID format for field '{self.name}', expected 'table:id'")
-            elif isinstance(validated, (list, tuple)) and len(validated) == 2:
+                if self.table_name:
+                    table = validated[:colon]
+                    if table != self.table_name:
+                        raise ValueError(f"RecordID must be from table '{self.table_name}', got '{table}'")
+                return validated
+
+            if cls is RecordID or isinstance(validated, RecordID):
+                pass
+            elif (cls is list or cls is tuple or isinstance(validated, (list, tuple))) and len(validated) == 2:
                 # Convert [table, id] to RecordID
                 table, id_val = validated
                 if not isinstance(table, str) or not table:
@@ -61,18 +75,13 @@ class RecordIDField(Field):
                 validated = RecordID(table, id_val)
             else:
                 raise TypeError(f"Expected record ID object, string or [table, id] list/tuple for field '{self.name}', got {type(validated)}")
-            
-            # Check table name constraint if specified
+
             # Check table name constraint if specified
             if validated and self.table_name:
-                if isinstance(validated, RecordID):
-                    table = getattr(validated, 'table_name', getattr(validated, 'table', None))
-                else:
-                    table, _ = validated.split(':', 1)
-
+                table = getattr(validated, 'table_name', getattr(validated, 'table', None))
                 if table != self.table_name:
                     raise ValueError(f"RecordID must be from table '{self.table_name}', got '{table}'")
-        
+
         return validated
 
     def to_db(self, value: Any) -> Optional[str]:
@@ -89,17 +98,47 @@ class RecordIDField(Field):
         if value is None:
             return None
 
+        cls = type(value)
+        if cls is RecordID:
+            return value
+        if cls is str:
+            table, sep, id_val = value.partition(':')
+            if sep:
+                return RecordID(table, id_val)
+            return value
+
         if isinstance(value, RecordID):
             return value
-        elif isinstance(value, str) and ':' in value:
-             table, id_val = value.split(':', 1)
-             return RecordID(table, id_val)
+        elif isinstance(value, str):
+            table, sep, id_val = value.partition(':')
+            if sep:
+                return RecordID(table, id_val)
+            return str(value)
         elif isinstance(value, (list, tuple)) and len(value) == 2:
             table, id_val = value
             return RecordID(table, id_val)
 
         return str(value)
 
+    def to_db_many(self, values: list[Any]) -> list[Any]:
+        """Convert a list of record IDs to database representation.
+
+        Equivalent to ``[self.to_db(v) for v in values]``; RecordID objects
+        and None are passed through without a method call. Used by
+        ``ListField.to_db`` for lists of record IDs.
+
+        Args:
+            values: The Python values to convert
+
+        Returns:
+            The record IDs for the database, in the same order
+        """
+        to_db = self.to_db
+        return [
+            value if value is None or type(value) is RecordID else to_db(value)
+            for value in values
+        ]
+
     def from_db(self, value: Any) -> Optional[str]:
         """Convert database value to Python representation.
 
@@ -1,3 +1,5 @@
+import functools
+from collections.abc import Callable
 from typing import Any, List, Optional, Type, Union
 
 from surrealdb import RecordID
@@ -5,6 +7,16 @@ from surrealdb import RecordID
 from .base import Field
 
 
+@functools.lru_cache(maxsize=8192)
+def _format_record_id(prefix: str, id_val: str) -> str:
+    """Return ``prefix + id_val``, reusing the string for repeated IDs.
+
+    Bulk writes often relate many documents to the same few records; the cache
+    hands back one shared string instead of allocating a new one each time.
+    """
+    return prefix + id_val
+
+
 class ReferenceField(Field):
     """Reference to another document.
 
@@ -38,6 +50,8 @@ class ReferenceField(Field):
         ...     reviewer = ReferenceField(User)
     """
 
+    __slots__ = ('_to_db_dispatch', 'document_type', 'on_delete', 'on_delete_then', 'reference')
+
     def __init__(self, document_type: Type, **kwargs: Any) -> None:
         """Initialize a new ReferenceField.
 
@@ -83,6 +97,8 @@ class ReferenceField(Field):
         if self.on_delete_then is not None and self.on_delete is None:
             self.on_delete = "THEN"
 
+        # to_db conversions keyed by the exact type of the value
+        self._to_db_dispatch: dict[type, Callable[[Any, Any], Any]] = {}
         super().__init__(**kwargs)
         self.py_type = Union[Type, str, dict]
 
@@ -214,35 +230,69 @@ class ReferenceField(Field):
         if value is None:
             return None
 
-        if isinstance(value, str):
-            if ":" in value:
-                table, id_part = value.split(":", 1)
-                return RecordID(table, id_part)
-            return value
+        converter = self._to_db_dispatch.get(type(value))
+        if converter is None:
+            converter = self._to_db_converter(type(value))
+        return converter(self, value)
 
-        # If it's a RecordID object
-        if isinstance(value, RecordID):
-            return value
+    def _to_db_converter(self, value_type: type) -> Callable[[Any, Any], Any]:
+        """Return the to_db conversion for values of ``value_type``.
 
-        # If it's a document instance (handle string forward refs via duck-typing)
-        resolved = self._resolve_document_type()
-        if resolved is not None:
-            if isinstance(value, resolved):
-                if value.id is None:
-                    raise ValueError(
-                        f"Cannot reference an unsaved {resolved.__name__} document"
-                    )
-                return self._coerce_record_id(value.id)
-        elif hasattr(value, "id") and not isinstance(value, (str, dict, RecordID)):
-            # Unresolved forward ref — treat any object with .id as a document instance
-            if value.id is None:
-                raise ValueError(f"Cannot reference an unsaved document")
-            return self._coerce_record_id(value.id)
+        The returned function takes ``(field, value)`` and is cached per type,
+        except while a forward-referenced document type cannot be resolved
+        yet: that lookup is repeated until it succeeds.
+        """
+        if issubclass(value_type, str):
+            converter = ReferenceField._str_to_db
+        elif issubclass(value_type, RecordID):
+            converter = ReferenceField._passthrough_to_db
+        else:
+            resolved = self._resolve_document_type()
+            if resolved is None:
+                return ReferenceField._unresolved_to_db
+            if issubclass(value_type, resolved):
+                converter = ReferenceField._document_to_db
+            elif issubclass(value_type, dict):
+                converter = ReferenceField._dict_to_db
+            else:
+                converter = ReferenceField._passthrough_to_db
+        self._to_db_dispatch[value_type] = converter
+        return converter
+
+    def _passthrough_to_db(self, value: Any) -> Any:
+        """Return values that need no conversion (e.g. RecordIDs) as is."""
+        return value
+
+    def _str_to_db(self, value: str) -> Any:
+        """Convert a ``table:id`` string to a RecordID; other strings pass through."""
+        if ":" in value:
+            table, id_part = value.split(":", 1)
+            return RecordID(table, id_part)
+        return value
 
-        # If it's a dict (partial reference)
-        if isinstance(value, dict) and value.get("id"):
+    def _document_to_db(self, value: Any) -> Any:
+        """Convert a referenced document instance to its record ID."""
+        if value.id is None:
+            raise ValueError(
+                f"Cannot reference an unsaved {self._resolve_document_type().__name__} document"
+            )
+        return self._coerce_record_id(value.id)
+
+    def _dict_to_db(self, value: dict) -> Any:
+        """Convert a partial reference dict to its record ID."""
+        if value.get("id"):
             return self._coerce_record_id(value["id"])
+        return value
 
+    def _unresolved_to_db(self, value: Any) -> Any:
+        """Convert a value while the document type is an unresolved forward ref."""
+        if hasattr(value, "id") and not isinstance(value, (str, dict, RecordID)):
+            # Treat any object with .id as a document instance
+            if value.id is None:
+                raise ValueError("Cannot reference an unsaved document")
+            return self._coerce_record_id(value.id)
+        if isinstance(value, dict):
+            return ReferenceField._dict_to_db(self, value)
         return value
 
     def from_db(self, value: Any, dereference: bool = False) -> Any:
@@ -299,6 +349,8 @@ class RelationField(Field):
         to_document: The type of document being related to
     """
 
+    __slots__ = ('_collection_name', '_collection_prefix', '_to_db_dispatch', '_valid_types', 'to_document')
+
     def __init__(self, to_document: Type, **kwargs: Any) -> None:
         """Initialize a new RelationField.
 
@@ -315,9 +367,27 @@ class RelationField(Field):
             index_with: List of other field names to include in the index
         """
         self.to_document = to_document
+        # Types accepted by validate, built once rather than per call
+        self._valid_types = (to_document, str, dict, RecordID)
+        # Resolved lazily on first use; see _get_collection_prefix
+        self._collection_name: str | None = None
+        self._collection_prefix: str | None = None
+        # to_db converter per value type, filled in as types are seen
+        self._to_db_dispatch: dict[type, Callable[[Any, Any], Any]] = {}
         super().__init__(**kwargs)
         self.py_type = Union[Type, str, dict]
 
+    def _get_collection_prefix(self) -> str:
+        """Return the ``"<collection>:"`` prefix of the related document.
+
+        The collection name is resolved once and cached on the field.
+        """
+        prefix = self._collection_prefix
+        if prefix is None:
+            self._collection_name = self.to_document._get_collection_name()
+            prefix = self._collection_prefix = f"{self._collection_name}:"
+        return prefix
+
     def validate(self, value: Any) -> Any:
         """Validate the relation value.
 
@@ -335,7 +405,7 @@ class RelationField(Field):
         """
         value = super().validate(value)
         if value is not None:
-            if not isinstance(value, (self.to_document, str, dict, RecordID)):
+            if not isinstance(value, self._valid_types):
                 raise TypeError(
                     f"Expected {self.to_document.__name__}, id string, record dict, or RecordID for field '{self.name}', got {type(value)}"
                 )
@@ -360,40 +430,112 @@ class RelationField(Field):
         if value is None:
             return None
 
-        if isinstance(value, str):
-            if ":" not in value:
-                return RecordID(self.to_document._get_collection_name(), value)
-            table, id_part = value.split(":", 1)
-            return RecordID(table, id_part)
-
-        # If it's a RecordID object
-        if isinstance(value, RecordID):
-            return value
+        # Dispatch on the exact type; the isinstance() chain in
+        # _to_db_converter runs once per type seen
+        converter = self._to_db_dispatch.get(type(value))
+        if converter is None:
+            converter = self._to_db_dispatch[type(value)] = self._to_db_converter(type(value))
+        return converter(self, value)
 
-        # If it's a document instance
-        if isinstance(value, self.to_document):
-            if value.id is None:
-                raise ValueError(
-                    f"Cannot relate to an unsaved {self.to_document.__name__} document"
-                )
+    def to_db_many(self, values: list[Any]) -> list[Any]:
+        """Convert a list of relations to database representation.
 
-            # If the ID already includes the collection name, return it as is
-            if isinstance(value.id, str) and ":" in value.id:
-                return value.id
-            # Otherwise, add the collection name
-            return f"{self.to_document._get_collection_name()}:{value.id}"
+        Equivalent to ``[self.to_db(v) for v in values]``, but runs the
+        type dispatch inline instead of one method call per value. Used by
+        ``ListField.to_db`` for lists of relations.
 
-        # If it's a dict
-        if isinstance(value, dict) and value.get("id"):
-            id_val = value["id"]
-            # If the ID already includes the collection name, return it as is
-            if isinstance(id_val, str) and ":" in id_val:
-                return id_val
-            # Otherwise, add the collection name
-            return f"{self.to_document._get_collection_name()}:{id_val}"
+        Args:
+            values: The Python relations to convert
 
+        Returns:
+            The converted values, in the same order
+        """
+        dispatch = self._to_db_dispatch
+        result = []
+        append = result.append
+        for value in values:
+            if value is None:
+                append(None)
+                continue
+            converter = dispatch.get(type(value))
+            if converter is None:
+                converter = dispatch[type(value)] = self._to_db_converter(type(value))
+            append(converter(self, value))
+        return result
+
+    def _to_db_converter(self, value_type: type) -> Callable[[Any, Any], Any]:
+        """Return the to_db conversion for values of ``value_type``.
+
+        The returned function takes ``(field, value)``; it is stored unbound
+        so copies of the field never call back into the original.
+        """
+        if issubclass(value_type, str):
+            return RelationField._str_to_db
+        # RecordID objects pass through as is
+        if issubclass(value_type, RecordID):
+            return RelationField._passthrough_to_db
+        if issubclass(value_type, self.to_document):
+            return RelationField._document_to_db
+        if value_type is dict:
+            return RelationField._dict_to_db
+        if issubclass(value_type, dict):
+            return RelationField._dict_subclass_to_db
+        return RelationField._passthrough_to_db
+
+    def _passthrough_to_db(self, value: Any) -> Any:
+        """Return values that need no conversion as is."""
         return value
 
+    def _str_to_db(self, value: str) -> RecordID:
+        """Convert an ID string, with or without a table prefix, to a RecordID."""
+        if ":" not in value:
+            if self._collection_name is None:
+                self._get_collection_prefix()
+            return RecordID(self._collection_name, value)
+        table, id_part = value.split(":", 1)
+        return RecordID(table, id_part)
+
+    def _document_to_db(self, value: Any) -> Any:
+        """Convert a related document instance to its record ID."""
+        id_val = value.id
+        if id_val is None:
+            raise ValueError(
+                f"Cannot relate to an unsaved {self.to_document.__name__} document"
+            )
+
+        # If the ID already includes the collection name, return it as is
+        if isinstance(id_val, str) and ":" in id_val:
+            return id_val
+        # Otherwise, add the collection name
+        return _format_record_id(self._get_collection_prefix(), id_val if type(id_val) is str else str(id_val))
+
+    def _dict_to_db(self, value: dict) -> Any:
+        """Convert a record dict to its record ID."""
+        # Record dicts nearly always carry an id, so index it directly
+        # rather than paying for a get() method call
+        try:
+            id_val = value["id"]
+        except KeyError:
+            return value
+        if not id_val:
+            return value
+        # If the ID already includes the collection name, return it as is
+        if isinstance(id_val, str) and ":" in id_val:
+            return id_val
+        # Otherwise, add the collection name
+        return _format_record_id(self._get_collection_prefix(), id_val if type(id_val) is str else str(id_val))
+
+    def _dict_subclass_to_db(self, value: dict) -> Any:
+        """Convert a dict subclass to its record ID.
+
+        Indexing a subclass that defines ``__missing__`` (e.g. defaultdict)
+        would insert an ``id`` key, so only index once the key is known to
+        be present.
+        """
+        if "id" not in value:
+            return value
+        return RelationField._dict_to_db(self, value)
+
     def from_db(self, value: Any, dereference: bool = False) -> Any:
         """Convert database relation to Python representation.
 
@@ -1,8 +1,169 @@
+import functools
 import re
+from collections.abc import Callable, Sequence
+from decimal import Decimal
 from typing import Any, Optional, Pattern, Union
 
 from .base import Field
 
+
+@functools.lru_cache(maxsize=1024)
+def _compile_regex(pattern: str | Pattern, flags: int = 0) -> Pattern:
+    """Compile ``pattern``, reusing the result for repeated pattern strings.
+
+    ``re``'s internal cache is small and evicted wholesale, so fields keep
+    their own bounded cache: StringFields declared with the same regex share
+    one Pattern, and RegexField values that recur across loaded documents are
+    compiled once.
+    """
+    return re.compile(pattern, flags)
+
+
+def _freeze_choices(choices: list | None) -> frozenset | tuple | None:
+    """Return ``choices`` as a frozenset for O(1) membership tests.
+
+    Falls back to a tuple when a choice is unhashable, and returns None when
+    there are no choices. The ordered list is kept separately on the field
+    for schema generation.
+    """
+    if not choices:
+        return None
+    try:
+        return frozenset(choices)
+    except TypeError:
+        return tuple(choices)
+
+
+# Number of regex-matched strings each field's string check remembers before
+# starting over
+_MATCHED_CACHE_SIZE = 4096
+
+
+def _check_str(name: str | None, value: Any) -> None:
+    """Value check for a StringField without constraints."""
+    if not isinstance(value, str):
+        raise TypeError(f"Expected string for field '{name}', got {type(value)}")
+
+
+class _StringCheck:
+    """Value check for a StringField with length, pattern or choice constraints.
+
+    Instances are called as ``check(field_name, value)`` with a non-None
+    value and raise on the first failed constraint. Each field builds its
+    own check, so the strings it remembers as matching its regex are bounded
+    per field and never leak between fields. Pickling goes through
+    :func:`_string_check`, which builds a fresh check.
+    """
+
+    __slots__ = ('choice_set', 'choices', 'match', 'matched', 'max_length', 'min_length', 'regex')
+
+    def __init__(self, min_length: int | None, max_length: int | None,
+                 regex: Pattern | None, choices: tuple | None) -> None:
+        self.min_length = min_length
+        self.max_length = max_length
+        self.regex = regex
+        self.choices = choices
+        self.match = regex.match if regex is not None else None
+        # Strings that already matched the regex; low-cardinality values
+        # (emails, slugs, status codes) are validated again and again on bulk
+        # writes
+        self.matched: set = set()
+        self.choice_set = _freeze_choices(choices)
+
+    def __call__(self, name: str | None, value: Any) -> None:
+        if not isinstance(value, str):
+            raise TypeError(f"Expected string for field '{name}', got {type(value)}")
+
+        if self.min_length is not None and len(value) < self.min_length:
+            raise ValueError(f"String value for '{name}' is too short")
+
+        if self.max_length is not None and len(value) > self.max_length:
+            raise ValueError(f"String value for '{name}' is too long")
+
+        if self.match is not None:
+            matched = self.matched
+            if value not in matched:
+                if not self.match(value):
+                    raise ValueError(f"String value for '{name}' does not match pattern")
+                if len(matched) >= _MATCHED_CACHE_SIZE:
+                    matched.clear()
+                matched.add(value)
+
+        if self.choice_set is not None and value not in self.choice_set:
+            raise ValueError(f"String value for '{name}' is not a valid choice")
+
+    def __reduce__(self) -> tuple:
+        return (_string_check, (self.min_length, self.max_length, self.regex, self.choices))
+
+
+def _string_check(min_length: int | None, max_length: int | None,
+                  regex: Pattern | None, choices: Sequence | None) -> Callable[[str | None, Any], None]:
+    """Return the value check for a StringField constraint set.
+
+    Only configured constraints are evaluated; a field without any shares
+    the plain type check.
+    """
+    if min_length is None and max_length is None and regex is None and not choices:
+        return _check_str
+    return _StringCheck(min_length, max_length, regex, tuple(choices) if choices else None)
+
+
+# Types accepted by NumberField; bool is rejected separately even though it
+# subclasses int
+_NUMERIC_TYPES = (int, float, Decimal)
+
+
+def _is_number(value: Any) -> bool:
+    """Return True if ``value`` is an int, float or Decimal but not a bool."""
+    cls = type(value)
+    if cls is int or cls is float:
+        return True
+    return cls is not bool and isinstance(value, _NUMERIC_TYPES)
+
+
+def _check_number(name: str | None, value: Any) -> None:
+    """Value check for a NumberField without bounds."""
+    if not _is_number(value):
+        raise TypeError(f"Expected number for field '{name}', got {type(value)}")
+
+
+class _NumberCheck:
+    """Value check for a NumberField with a lower and/or upper bound.
+
+    Called like :class:`_StringCheck`, and likewise pickled through
+    :func:`_number_check`.
+    """
+
+    __slots__ = ('max_value', 'min_value')
+
+    def __init__(self, min_value: Any, max_value: Any) -> None:
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def __call__(self, name: str | None, value: Any) -> None:
+        if not _is_number(value):
+            raise TypeError(f"Expected number for field '{name}', got {type(value)}")
+
+        if self.min_value is not None and value < self.min_value:
+            raise ValueError(f"Value for '{name}' is too small")
+
+        if self.max_value is not None and value > self.max_value:
+            raise ValueError(f"Value for '{name}' is too large")
+
+    def __reduce__(self) -> tuple:
+        return (_number_check, (self.min_value, self.max_value))
+
+
+def _number_check(min_value: Any, max_value: Any) -> Callable[[str | None, Any], None]:
+    """Return the value check for a NumberField's bounds.
+
+    Like :func:`_string_check`, unset bounds are skipped entirely.
+    """
+    if min_value is None and max_value is None:
+        return _check_number
+    return _NumberCheck(min_value, max_value)
+
+
 class StringField(Field):
     r"""String field type.
 
@@ -43,6 +204,8 @@ class StringField(Field):
         >>> name = StringField(required=True, define_schema=True)
     """
 
+    __slots__ = ('_check_value', '_choices', '_max_length', '_min_length', '_regex', 'regex_pattern')
+
     def __init__(self, min_length: Optional[int] = None, max_length: Optional[int] = None,
                  regex: Optional[str] = None, choices: Optional[list] = None, **kwargs: Any) -> None:
         """Initialize a new StringField.
@@ -62,14 +225,57 @@ class StringField(Field):
             analyzer: Analyzer to use for search indexes
             index_with: List of other field names to include in the index
         """
+        self._check_value: Callable[[str | None, Any], None] | None = None
         self.min_length = min_length
         self.max_length = max_length
-        self.regex: Optional[Pattern] = re.compile(regex) if regex else None
+        self.regex = regex
         self.regex_pattern: Optional[str] = regex
-        self.choices: Optional[list] = choices
+        self.choices = choices
         super().__init__(**kwargs)
         self.py_type = str
 
+    # The constraints are properties so that changing one after construction
+    # drops the cached value check; validate() rebuilds it on next use
+
+    @property
+    def min_length(self) -> int | None:
+        return self._min_length
+
+    @min_length.setter
+    def min_length(self, min_length: int | None) -> None:
+        self._min_length = min_length
+        self._check_value = None
+
+    @property
+    def max_length(self) -> int | None:
+        return self._max_length
+
+    @max_length.setter
+    def max_length(self, max_length: int | None) -> None:
+        self._max_length = max_length
+        self._check_value = None
+
+    @property
+    def regex(self) -> Pattern | None:
+        return self._regex
+
+    @regex.setter
+    def regex(self, regex: str | Pattern | None) -> None:
+        self._regex = _compile_regex(regex) if regex else None
+        self._check_value = None
+
+    @property
+    def choices(self) -> list | None:
+        # Stays an ordered list (schema generation iterates it); the value
+        # check tests membership against a frozen copy, so reassign rather
+        # than mutate it in place
+        return self._choices
+
+    @choices.setter
+    def choices(self, choices: list | None) -> None:
+        self._choices = choices
+        self._check_value = None
+
     def validate(self, value: Any) -> Optional[str]:
         """Validate the string value.
 
@@ -88,20 +294,11 @@ class StringField(Field):
         """
         value = super().validate(value)
         if value is not None:
-            if not isinstance(value, str):
-                raise TypeError(f"Expected string for field '{self.name}', got {type(value)}")
-
-            if self.min_length is not None and len(value) < self.min_length:
-                raise ValueError(f"String value for '{self.name}' is too short")
-
-            if self.max_length is not None and len(value) > self.max_length:
-                raise ValueError(f"String value for '{self.name}' is too long")
-
-            if self.regex and not self.regex.match(value):
-                raise ValueError(f"String value for '{self.name}' does not match pattern")
-
-            if self.choices and value not in self.choices:
-                raise ValueError(f"String value for '{self.name}' is not a valid choice")
+            check = self._check_value
+            if check is None:
+                check = self._check_value = _string_check(
+                    self._min_length, self._max_length, self._regex, self._choices)
+            check(self.name, value)
 
         return value
 
@@ -132,6 +329,8 @@ class NumberField(Field):
         >>> price = NumberField(min_value=0, required=True)
     """
 
+    __slots__ = ('_check_value', '_max_value', '_min_value')
+
     def __init__(self, min_value: Optional[Union[int, float]] = None,
                  max_value: Optional[Union[int, float]] = None, **kwargs: Any) -> None:
         """Initialize a new NumberField.
@@ -149,11 +348,33 @@ class NumberField(Field):
             analyzer: Analyzer to use for search indexes
             index_with: List of other field names to include in the index
         """
+        self._check_value: Callable[[str | None, Any], None] | None = None
         self.min_value = min_value
         self.max_value = max_value
         super().__init__(**kwargs)
         self.py_type = Union[int, float]
 
+    # Like StringField's constraints, the bounds drop the cached value check
+    # when they change
+
+    @property
+    def min_value(self) -> float | None:
+        return self._min_value
+
+    @min_value.setter
+    def min_value(self, min_value: float | None) -> None:
+        self._min_value = min_value
+        self._check_value = None
+
+    @property
+    def max_value(self) -> float | None:
+        return self._max_value
+
+    @max_value.setter
+    def max_value(self, max_value: float | None) -> None:
+        self._max_value = max_value
+        self._check_value = None
+
     def validate(self, value: Any) -> Optional[Union[int, float]]:
         """Validate the numeric value.
 
@@ -172,15 +393,10 @@ class NumberField(Field):
         """
         value = super().validate(value)
         if value is not None:
-            from decimal import Decimal
-            if not isinstance(value, (int, float, Decimal)):
-                raise TypeError(f"Expected number for field '{self.name}', got {type(value)}")
-
-            if self.min_value is not None and value < self.min_value:
-                raise ValueError(f"Value for '{self.name}' is too small")
-
-            if self.max_value is not None and value > self.max_value:
-                raise ValueError(f"Value for '{self.name}' is too large")
+            check = self._check_value
+            if check is None:
+                check = self._check_value = _number_check(self._min_value, self._max_value)
+            check(self.name, value)
 
         return value
 
@@ -208,6 +424,8 @@ class IntField(NumberField):
         >>> views = IntField(default=0, min_value=0)
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new IntField.
 
@@ -257,9 +475,11 @@ class IntField(NumberField):
         Returns:
             The integer value for the database
         """
-        if value is not None:
-            return int(value)
-        return value
+        # Exact ints (the common case once validated) pass through untouched;
+        # anything else, including bools, is still coerced with int()
+        if value is None or type(value) is int:
+            return value
+        return int(value)
 
 
 class FloatField(NumberField):
@@ -285,6 +505,8 @@ class FloatField(NumberField):
         >>> tax_rate = FloatField(min_value=0.0, max_value=1.0)
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new FloatField.
 
@@ -319,12 +541,17 @@ class FloatField(NumberField):
             TypeError: If the value cannot be converted to a float
         """
         value = super().validate(value)
-        if value is not None:
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                raise TypeError(f"Expected float for field '{self.name}', got {type(value)}")
-        return value
+        # Exact floats are returned as is and ints converted directly; only
+        # other numeric types go through the guarded conversion
+        cls = type(value)
+        if value is None or cls is float:
+            return value
+        if cls is int:
+            return float(value)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise TypeError(f"Expected float for field '{self.name}', got {type(value)}")
 
 
 class BooleanField(Field):
@@ -349,6 +576,8 @@ class BooleanField(Field):
         >>> active = BooleanField(default=True, indexed=True)
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new BooleanField.
 
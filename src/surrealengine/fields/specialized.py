@@ -1,17 +1,39 @@
-import re
-import uuid
+import binascii
 import decimal
-import base64
-import socket
-import urllib.parse
+import functools
 import io
 import os
+import re
+import socket
+import urllib.parse
+import uuid
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Pattern, Union, BinaryIO
+from typing import Any, BinaryIO, Dict, List, Optional, Pattern, Union
 
-from .base import Field
-from .scalar import StringField, NumberField
 from ..exceptions import ValidationError
+from .base import Field
+from .scalar import NumberField, StringField, _compile_regex, _freeze_choices
+
+# BytesField payload codec. pybase64, when installed, encodes and decodes
+# with SIMD; otherwise the binascii C functions that base64.b64encode and
+# b64decode wrap are called directly, skipping a Python frame per conversion.
+# Both raise binascii.Error on malformed input.
+try:
+    from pybase64 import b64decode as _b64decode
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    _b64encode = functools.partial(binascii.b2a_base64, newline=False)
+    _b64decode = binascii.a2b_base64
+
+# SurrealDB bytes literal: <bytes>"<base64 payload>"
+_BYTES_PREFIX = '<bytes>"'
+_BYTES_PREFIX_LEN = len(_BYTES_PREFIX)
+
+# typing.Pattern is a generic alias whose isinstance() goes through
+# __instancecheck__; re.Pattern cannot be subclassed, so an exact type check
+# against it is equivalent and much cheaper
+_RE_PATTERN = re.Pattern
+_UUID = uuid.UUID
 
 class BytesFieldWrapper:
     """File-like wrapper for BytesField data.
@@ -342,6 +364,8 @@ class BytesField(Field):
         doc.file_data.write_text("Hello, World!")
     """
 
+    __slots__ = ('_wrapper', 'allowed_types', 'max_size')
+
     def __init__(self, max_size: Optional[int] = None, 
                  allowed_types: Optional[List[str]] = None, **kwargs: Any) -> None:
         """Initialize a new BytesField.
@@ -425,10 +449,10 @@ class BytesField(Field):
         if isinstance(value, bytes):
             # Convert bytes to SurrealDB bytes format
             # SurrealDB uses <bytes>"base64_encoded_string" format
-            encoded = base64.b64encode(value).decode('ascii')
-            return f'<bytes>"{encoded}"'
+            encoded = _b64encode(value).decode('ascii')
+            return f'{_BYTES_PREFIX}{encoded}"'
 
-        if isinstance(value, str) and value.startswith('<bytes>"') and value.endswith('"'):
+        if isinstance(value, str) and value.startswith(_BYTES_PREFIX) and value.endswith('"'):
             # If it's already in SurrealDB bytes format, return as is
             return value
 
@@ -447,20 +471,40 @@ class BytesField(Field):
             The BytesFieldWrapper object
         """
         if value is not None:
-            data = None
-            
             if isinstance(value, bytes):
-                data = value
-            elif isinstance(value, str) and value.startswith('<bytes>"') and value.endswith('"'):
-                # Extract the base64-encoded string from <bytes>"..." format
-                encoded = value[8:-1]  # Remove <bytes>" and "
-                data = base64.b64decode(encoded)
-            
-            if data is not None:
-                return BytesFieldWrapper(data)
-        
+                return BytesFieldWrapper(value)
+            if isinstance(value, str) and value.startswith(_BYTES_PREFIX) and value.endswith('"'):
+                # Decode the base64 payload between <bytes>" and the closing quote
+                return BytesFieldWrapper(_b64decode(value[_BYTES_PREFIX_LEN:-1]))
+
         return value
 
+    def from_db_many(self, values: list[Any]) -> list[Any]:
+        """Convert a column of database values to BytesFieldWrappers.
+
+        Equivalent to ``[self.from_db(v) for v in values]``, but raw bytes and
+        ``<bytes>"..."`` literals are decoded inline instead of one method
+        call per value.
+
+        Args:
+            values: The database values to convert
+
+        Returns:
+            The converted values, in the same order
+        """
+        wrap = BytesFieldWrapper
+        a2b = _b64decode
+        prefix = _BYTES_PREFIX
+        prefix_len = _BYTES_PREFIX_LEN
+        from_db = self.from_db
+        return [
+            wrap(value) if type(value) is bytes
+            else wrap(a2b(value[prefix_len:-1]))
+            if type(value) is str and value[:prefix_len] == prefix and value[-1:] == '"'
+            else from_db(value)
+            for value in values
+        ]
+
     def open(self, data: Optional[bytes] = None, **kwargs) -> BytesFieldWrapper:
         """Open a file-like interface for the bytes data.
         
@@ -598,6 +642,23 @@ class BytesField(Field):
         return self.size > 0
 
 
+@functools.lru_cache(maxsize=1024)
+def _regex_literal(value: Pattern) -> str:
+    """Return the SurrealDB ``/pattern/flags`` literal for a compiled regex.
+
+    Patterns hash and compare by pattern string and flags, so the literal is
+    built once per distinct regex.
+    """
+    flags = ""
+    if value.flags & re.IGNORECASE:
+        flags += "i"
+    if value.flags & re.MULTILINE:
+        flags += "m"
+    if value.flags & re.DOTALL:
+        flags += "s"
+    return f"/{value.pattern}/{flags}"
+
+
 class RegexField(Field):
     """Regular expression field type.
 
@@ -605,6 +666,8 @@ class RegexField(Field):
     conversion between Python regex objects and SurrealDB regex format.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new RegexField.
 
@@ -632,11 +695,11 @@ class RegexField(Field):
         """
         value = super().validate(value)
         if value is not None:
-            if isinstance(value, Pattern):
+            if type(value) is _RE_PATTERN:
                 return value
             if isinstance(value, str):
                 try:
-                    return re.compile(value)
+                    return _compile_regex(value)
                 except re.error as e:
                     raise ValueError(f"Invalid regex pattern for field '{self.name}': {str(e)}")
             raise TypeError(f"Expected regex pattern for field '{self.name}', got {type(value)}")
@@ -657,18 +720,8 @@ class RegexField(Field):
         if value is None:
             return None
 
-        if isinstance(value, Pattern):
-            # Convert regex pattern to SurrealDB regex format
-            # SurrealDB uses /pattern/flags format
-            pattern = value.pattern
-            flags = ""
-            if value.flags & re.IGNORECASE:
-                flags += "i"
-            if value.flags & re.MULTILINE:
-                flags += "m"
-            if value.flags & re.DOTALL:
-                flags += "s"
-            return f"/{pattern}/{flags}"
+        if type(value) is _RE_PATTERN:
+            return _regex_literal(value)
 
         if isinstance(value, str):
             # If it's already a string, assume it's in the correct format
@@ -689,11 +742,13 @@ class RegexField(Field):
             The Python regex pattern
         """
         if value is not None:
-            if isinstance(value, Pattern):
+            if type(value) is _RE_PATTERN:
                 return value
-            if isinstance(value, str) and value.startswith('/') and '/' in value[1:]:
+            # A /pattern/flags literal starts with '/' and has a closing '/'
+            # after it; one rfind() covers both without copying value[1:]
+            last_slash = value.rfind('/') if isinstance(value, str) and value[:1] == '/' else -1
+            if last_slash > 0:
                 # Parse /pattern/flags format
-                last_slash = value.rindex('/')
                 pattern = value[1:last_slash]
                 flags_str = value[last_slash + 1:]
                 flags = 0
@@ -703,16 +758,34 @@ class RegexField(Field):
                     flags |= re.MULTILINE
                 if 's' in flags_str:
                     flags |= re.DOTALL
-                return re.compile(pattern, flags)
+                return _compile_regex(pattern, flags)
         return value
 
 
+def _decimals_from_db_batch(values: list[Any]) -> list[Any] | None:
+    """Convert database values to Decimals in one pass.
+
+    Returns None if any value cannot be converted, so the caller can fall back
+    to per-value conversion (which passes such values through unchanged).
+    """
+    try:
+        return [
+            value if value is None or type(value) is Decimal
+            else Decimal(value if type(value) is str or type(value) is int else str(value))
+            for value in values
+        ]
+    except (TypeError, ValueError, decimal.InvalidOperation):
+        return None
+
+
 class DecimalField(NumberField):
     """Decimal field type.
 
     This field type stores decimal values with arbitrary precision using Python's
     Decimal class. It provides validation to ensure the value is a valid decimal."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new DecimalField.
 
@@ -741,6 +814,10 @@ class DecimalField(NumberField):
         if value is not None:
             if isinstance(value, Decimal):
                 return value
+            # Ints convert exactly without a string round-trip; floats still
+            # go through str() so 0.1 stays Decimal('0.1')
+            if type(value) is int:
+                return Decimal(value)
             try:
                 return Decimal(str(value))
             except (TypeError, ValueError, decimal.InvalidOperation):
@@ -760,10 +837,12 @@ class DecimalField(NumberField):
             The string representation for the database
         """
         if value is not None:
-            if isinstance(value, Decimal):
+            cls = type(value)
+            # Decimals and ints already have their canonical decimal string
+            if cls is Decimal or cls is int or isinstance(value, Decimal):
                 return str(value)
             try:
-                return str(Decimal(str(value)))
+                return str(Decimal(value if cls is str else str(value)))
             except (TypeError, ValueError, decimal.InvalidOperation):
                 pass
         return value
@@ -780,12 +859,35 @@ class DecimalField(NumberField):
             The Python Decimal object
         """
         if value is not None:
+            cls = type(value)
+            if cls is Decimal:
+                return value
             try:
-                return Decimal(str(value))
-            except (TypeError, ValueError):
+                return Decimal(value if cls is str or cls is int else str(value))
+            except (TypeError, ValueError, decimal.InvalidOperation):
                 pass
         return value
 
+    def from_db_many(self, values: list[Any]) -> list[Any]:
+        """Convert a column of database values to Python Decimals.
+
+        Equivalent to ``[self.from_db(v) for v in values]``, but converts the
+        whole column in a single comprehension instead of one method call per
+        value.
+
+        Args:
+            values: The database values to convert
+
+        Returns:
+            The converted values, in the same order
+        """
+        converted = _decimals_from_db_batch(values)
+        if converted is None:
+            # Some value needs from_db's per-value fallback
+            from_db = self.from_db
+            converted = [from_db(value) for value in values]
+        return converted
+
 
 class UUIDField(Field):
     """UUID field type.
@@ -799,6 +901,8 @@ class UUIDField(Field):
             id = UUIDField(default=uuid.uuid4)
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a new UUIDField.
 
@@ -825,7 +929,7 @@ class UUIDField(Field):
         """
         value = super().validate(value)
         if value is not None:
-            if isinstance(value, uuid.UUID):
+            if type(value) is _UUID or isinstance(value, _UUID):
                 return value
             if isinstance(value, str):
                 try:
@@ -846,9 +950,10 @@ class UUIDField(Field):
         Returns:
             The string representation for the database
         """
-        if value is not None:
-            return str(value)
-        return value
+        # Strings are stored as-is (validate() already checked them)
+        if value is None or type(value) is str:
+            return value
+        return str(value)
 
     def from_db(self, value: Any) -> Optional[uuid.UUID]:
         """Convert database value to Python UUID.
@@ -862,7 +967,7 @@ class UUIDField(Field):
             The Python UUID object
         """
         if value is not None:
-            if isinstance(value, uuid.UUID):
+            if type(value) is _UUID or isinstance(value, _UUID):
                 return value
             if isinstance(value, str):
                 try:
@@ -976,11 +1081,34 @@ class LiteralField(Field):
             **kwargs: Additional arguments to pass to the parent class
         """
         self.allowed_values = allowed_values
-        self.allowed_fields = [v for v in allowed_values if isinstance(v, Field)]
-        self.allowed_literals = [v for v in allowed_values if not isinstance(v, Field)]
+        # Split once and never mutated, so stored as tuples
+        self.allowed_fields = tuple(v for v in allowed_values if isinstance(v, Field))
+        self.allowed_literals = tuple(v for v in allowed_values if not isinstance(v, Field))
+        self._literal_set = _freeze_choices(self.allowed_literals)
+        # validate()'s error message, minus the field name that is only
+        # known once the field is bound to a document
+        field_types = ", ".join(f.__class__.__name__ for f in self.allowed_fields)
+        if self.allowed_literals:
+            literals_str = ", ".join(repr(v) for v in self.allowed_literals)
+            self._error_detail = f"must be one of: {literals_str}"
+            if self.allowed_fields:
+                self._error_detail += f" or a valid {field_types}"
+        else:
+            self._error_detail = f"must be a valid {field_types}"
         super().__init__(**kwargs)
         self.py_type = Any
 
+    def _is_literal(self, value: Any) -> bool:
+        """Return True if ``value`` is one of the allowed literals."""
+        literal_set = self._literal_set
+        if literal_set is None:
+            return False
+        try:
+            return value in literal_set
+        except TypeError:
+            # Unhashable value tested against a frozenset of hashable literals
+            return False
+
     def validate(self, value: Any) -> Any:
         """Validate that the value is one of the allowed values or types.
 
@@ -999,7 +1127,7 @@ class LiteralField(Field):
             return None
 
         # Check if the value is one of the allowed literals
-        if value in self.allowed_literals:
+        if self._is_literal(value):
             return value
 
         # Try to validate with each allowed field type
@@ -1010,17 +1138,7 @@ class LiteralField(Field):
                 continue
 
         # If we get here, the value is not valid
-        if self.allowed_literals:
-            literals_str = ", ".join(repr(v) for v in self.allowed_literals)
-            error_msg = f"Value for field '{self.name}' must be one of: {literals_str}"
-            if self.allowed_fields:
-                field_types = ", ".join(f.__class__.__name__ for f in self.allowed_fields)
-                error_msg += f" or a valid {field_types}"
-        else:
-            field_types = ", ".join(f.__class__.__name__ for f in self.allowed_fields)
-            error_msg = f"Value for field '{self.name}' must be a valid {field_types}"
-
-        raise ValidationError(error_msg)
+        raise ValidationError(f"Value for field '{self.name}' {self._error_detail}")
 
     def to_db(self, value: Any) -> Any:
         """Convert Python value to database representation.
@@ -1038,7 +1156,7 @@ class LiteralField(Field):
             return None
 
         # If it's a literal, return as is
-        if value in self.allowed_literals:
+        if self._is_literal(value):
             return value
 
         # Try to convert with each allowed field type
@@ -1067,7 +1185,7 @@ class LiteralField(Field):
             return None
 
         # If it's a literal, return as is
-        if value in self.allowed_literals:
+        if self._is_literal(value):
             return value
 
         # Try to convert with each allowed field type
@@ -1134,6 +1252,12 @@ class EmailField(StringField):
         return value
 
 
+# Host-only URL check used by URLField, compiled once for all instances
+_HOSTNAME_RE = re.compile(
+    r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
+)
+
+
 class URLField(StringField):
     """Enhanced URL field type with urllib integration.
 
@@ -1250,14 +1374,13 @@ class URLField(StringField):
         Returns:
             True if valid hostname, False otherwise
         """
-        # Basic hostname validation
-        hostname_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
-        
         # Allow localhost and IP addresses
         if hostname in ['localhost', '127.0.0.1'] or hostname.startswith('192.168.') or hostname.startswith('10.'):
             return True
             
-        return bool(re.match(hostname_pattern, hostname)) and len(hostname) <= 253
+        # Basic hostname validation; the length cap is checked first so
+        # oversized input never reaches the regex
+        return len(hostname) <= 253 and bool(_HOSTNAME_RE.match(hostname))
 
     # URL Component Properties
     @property
@@ -1459,23 +1582,22 @@ class IPAddressField(StringField):
         """
         value = super().validate(value)
         if value is not None:
+            # Every IPv6 address contains a colon and no IPv4 address does,
+            # so only the matching parser is tried and the other one never
+            # has to raise
+            has_colon = ':' in value
+
             # Validate IPv4 address
-            if self.ipv4_only or not self.ipv6_only:
-                ipv4_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-                if re.match(ipv4_pattern, value):
-                    # Check that each octet is in the valid range
-                    octets = value.split('.')
-                    try:
-                        if all(0 <= int(octet) <= 255 for octet in octets):
-                            return value
-                        if self.ipv4_only:
-                            raise ValueError(f"Invalid IPv4 address for field '{self.name}': octets must be between 0 and 255")
-                    except ValueError:
-                        if self.ipv4_only:
-                            raise ValueError(f"Invalid IPv4 address for field '{self.name}': octets must be numeric")
+            if not has_colon and (self.ipv4_only or not self.ipv6_only):
+                try:
+                    # inet_pton parses and range-checks the dotted quad in C
+                    socket.inet_pton(socket.AF_INET, value)
+                    return value
+                except (OSError, ValueError):
+                    pass
 
             # Validate IPv6 address
-            if self.ipv6_only or not self.ipv4_only:
+            if has_colon and (self.ipv6_only or not self.ipv4_only):
                 try:
                     # Use socket.inet_pton to validate IPv6 address
                     socket.inet_pton(socket.AF_INET6, value)
@@ -1563,7 +1685,9 @@ class ChoiceField(Field):
             **kwargs: Additional arguments to pass to the parent class
         """
         self.choices = choices
-        self.values = [c[0] if isinstance(c, tuple) else c for c in choices]
+        self.values = tuple(c[0] if isinstance(c, tuple) else c for c in choices)
+        # Membership set for validate(); self.values keeps the declared order
+        self._value_set = _freeze_choices(self.values) or frozenset()
         super().__init__(**kwargs)
         self.py_type = str
 
@@ -1582,7 +1706,14 @@ class ChoiceField(Field):
             ValueError: If the value is not one of the allowed choices
         """
         value = super().validate(value)
-        if value is not None and value not in self.values:
+        if value is None:
+            return value
+        try:
+            valid = value in self._value_set
+        except TypeError:
+            # Unhashable value tested against a frozenset of hashable choices
+            valid = False
+        if not valid:
             choices_str = ", ".join(repr(v) for v in self.values)
             raise ValueError(f"Value for field '{self.name}' must be one of: {choices_str}")
         return value
@@ -3,12 +3,39 @@
 This module provides comprehensive support for different RecordID formats
 including string, URL-encoded, and complex ID types.
 """
+import functools
 import re
 import urllib.parse
 from typing import Any, Optional, Tuple
+
 from surrealdb import RecordID
 
 
+@functools.lru_cache(maxsize=8192)
+def _record_id_str(table_name: str, id_val: Any) -> str:
+    """Format a RecordID from its parts; cached by :func:`record_id_to_str`."""
+    return str(RecordID(table_name, id_val))
+
+
+# ID types whose equal values always format the same way. Other types can
+# compare equal yet print differently (0.0 and -0.0, Decimal('1.0') and
+# Decimal('1.00'), (1,) and (True,)), so they are never cached.
+_CACHEABLE_ID_TYPES = (str, int)
+
+
+def record_id_to_str(record_id: RecordID) -> str:
+    """Return ``str(record_id)``, reusing the string for repeated IDs.
+
+    ``RecordID.__str__`` rescans string IDs for characters that need escaping
+    on every call; bulk writes and query building stringify the same few
+    records over and over. Only exact string and integer IDs of plain
+    RecordIDs are cached; anything else is formatted directly.
+    """
+    if type(record_id) is RecordID and type(record_id.id) in _CACHEABLE_ID_TYPES:
+        return _record_id_str(record_id.table_name, record_id.id)
+    return str(record_id)
+
+
 class RecordIdUtils:
     """Utilities for working with SurrealDB RecordIDs in various formats."""
     
@@ -65,7 +92,7 @@ class RecordIdUtils:
             
         # Handle RecordID objects
         if isinstance(record_id, RecordID):
-            return str(record_id)
+            return record_id_to_str(record_id)
             
         # Convert to string
         if not isinstance(record_id, str):
@@ -0,0 +1,54 @@
+import pytest
+
+from surrealengine.fields import BytesField, DictField, FloatField, IntField, ListField, StringField
+
+
+def _list_field(field_type):
+    field = ListField(field_type)
+    field.name = 'items'
+    return field
+
+
+def test_list_of_bytes_validates_items():
+    # A BytesField holding no data is falsy (it defines __bool__), but its
+    # items must be validated all the same
+    field = _list_field(BytesField())
+
+    assert field.validate([b'a', b'b']) == [b'a', b'b']
+    with pytest.raises(ValueError, match='item 1'):
+        field.validate([b'a', 1])
+
+
+@pytest.mark.parametrize('field_type', [IntField(), IntField(min_value=0), FloatField()])
+def test_list_of_numbers_rejects_bool_items(field_type):
+    field = _list_field(field_type)
+
+    with pytest.raises(ValueError, match='item 1'):
+        field.validate([1, True])
+
+
+def test_list_of_ints_checks_bounds():
+    field = _list_field(IntField(min_value=0, max_value=10))
+
+    assert field.validate([0, 5, 10]) == [0, 5, 10]
+    with pytest.raises(ValueError, match='item 2'):
+        field.validate([0, 5, 11])
+
+
+def test_list_field_type_can_be_reassigned():
+    field = _list_field(IntField())
+    field.field_type = StringField()
+
+    assert field.validate(['a', 'b']) == ['a', 'b']
+    with pytest.raises(ValueError, match='item 0'):
+        field.validate([1])
+
+
+def test_dict_field_type_can_be_reassigned():
+    field = DictField(IntField())
+    field.name = 'values'
+    field.field_type = StringField()
+
+    assert field.validate({'a': 'b'}) == {'a': 'b'}
+    with pytest.raises(ValueError, match="key 'a'"):
+        field.validate({'a': 1})
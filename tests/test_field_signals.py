@@ -0,0 +1,65 @@
+import pytest
+
+from surrealengine import Document
+from surrealengine.fields import Field, ListField, OptionField, StringField
+from surrealengine.signals import SIGNAL_SUPPORT, post_from_db, pre_to_db
+
+pytestmark = pytest.mark.skipif(not SIGNAL_SUPPORT, reason="blinker is not installed")
+
+
+class Article(Document):
+    raw = Field()
+    title = StringField()
+    tags = ListField(StringField())
+    subtitle = OptionField(StringField())
+
+
+@pytest.fixture
+def received():
+    calls = []
+
+    def on_pre_to_db(sender, field, value):
+        calls.append((sender, value))
+
+    pre_to_db.connect(on_pre_to_db)
+    yield calls
+    pre_to_db.disconnect(on_pre_to_db)
+
+
+def test_to_db_works_on_fields_of_defined_documents():
+    assert Field().to_db('x') == 'x'
+    assert StringField().to_db('x') == 'x'
+    assert StringField().is_identity_to_db()
+
+
+def test_receiver_connected_after_document_definition(received):
+    assert StringField().to_db('x') == 'x'
+    assert Field().to_db('y') == 'y'
+    assert Article._fields['title'].to_db('z') == 'z'
+
+    assert received == [(StringField, 'x'), (Field, 'y'), (StringField, 'z')]
+    assert not StringField().is_identity_to_db()
+
+
+def test_receiver_reaches_wrapped_and_item_fields(received):
+    Article._fields['subtitle'].to_db('sub')
+    Article._fields['tags'].to_db(['a', 'b'])
+
+    assert (StringField, 'sub') in received
+    assert {'a', 'b'} <= {value for _, value in received}
+
+
+def test_from_db_receiver_after_document_definition():
+    calls = []
+
+    def on_post_from_db(sender, field, value):
+        calls.append(value)
+
+    post_from_db.connect(on_post_from_db)
+    try:
+        assert Article._fields['title'].from_db('x') == 'x'
+    finally:
+        post_from_db.disconnect(on_post_from_db)
+
+    assert calls == ['x']
+    assert StringField().is_identity_from_db()
@@ -0,0 +1,36 @@
+import pytest
+from surrealdb.data.types.geometry import GeometryPoint, GeometryPolygon
+
+from surrealengine.exceptions import ValidationError
+from surrealengine.fields import GeometryField
+
+_RING = [[0, 0], [0, 1], [1, 1], [0, 0]]
+
+
+def _geometry_field(**kwargs):
+    field = GeometryField(**kwargs)
+    field.name = 'area'
+    return field
+
+
+def test_geometry_type_accepts_matching_sdk_object():
+    point = GeometryPoint(-122.4194, 37.7749)
+
+    assert _geometry_field(geometry_type='Point').validate(point) is point
+
+
+def test_geometry_type_rejects_other_sdk_object():
+    polygon = GeometryPolygon.parse_coordinates([_RING])
+
+    with pytest.raises(ValidationError, match="type 'Point'"):
+        _geometry_field(geometry_type='Point').validate(polygon)
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'geometry_type': 'Point'}])
+def test_coordinate_pair_accepted_as_point(kwargs):
+    assert _geometry_field(**kwargs).validate((1.5, 2.5)) == [1.5, 2.5]
+
+
+def test_geometry_type_rejects_coordinate_pair():
+    with pytest.raises(ValidationError):
+        _geometry_field(geometry_type='Polygon').validate([1.5, 2.5])
@@ -0,0 +1,28 @@
+from decimal import Decimal
+
+import pytest
+from surrealdb import RecordID
+
+from surrealengine.record_id_utils import record_id_to_str
+
+
+@pytest.mark.parametrize('first, second', [
+    (0.0, -0.0),
+    (Decimal('1.0'), Decimal('1.00')),
+    ((1,), (True,)),
+    ((1, 2), (1.0, 2)),
+    (1, True),
+    (1, 1.0),
+])
+def test_equal_ids_that_print_differently_keep_their_own_string(first, second):
+    for id_val in (first, second, first):
+        record_id = RecordID('user', id_val)
+        assert record_id_to_str(record_id) == str(record_id)
+
+
+@pytest.mark.parametrize('id_val', ['alice', 'with space', 42, [1, 2], {'a': 1}])
+def test_record_id_to_str_matches_str(id_val):
+    record_id = RecordID('user', id_val)
+
+    assert record_id_to_str(record_id) == str(record_id)
+    assert record_id_to_str(record_id) == str(record_id)
@@ -0,0 +1,116 @@
+import pickle
+import re
+
+import pytest
+
+from surrealengine.fields import DecimalField, EmailField, FloatField, IntField, NumberField, StringField
+
+
+def _named(field, name='value'):
+    field.name = name
+    return field
+
+
+@pytest.mark.parametrize('cls', [NumberField, IntField, FloatField, DecimalField])
+@pytest.mark.parametrize('value', [True, False])
+def test_number_fields_reject_bool(cls, value):
+    with pytest.raises(TypeError, match='Expected number'):
+        _named(cls()).validate(value)
+
+
+@pytest.mark.parametrize('cls', [NumberField, IntField, FloatField, DecimalField])
+def test_number_fields_accept_numbers(cls):
+    assert _named(cls()).validate(1) == 1
+
+
+def test_string_field_pickle_round_trip():
+    field = _named(StringField(min_length=2, max_length=4, regex=r'^[a-z]+$', choices=['ab', 'abc']))
+    field.validate('ab')
+
+    restored = pickle.loads(pickle.dumps(field))
+
+    assert restored.regex_pattern == '^[a-z]+$'
+    assert restored.choices == ['ab', 'abc']
+    assert restored.validate('abc') == 'abc'
+    with pytest.raises(ValueError, match='not a valid choice'):
+        restored.validate('cd')
+    with pytest.raises(ValueError, match='does not match pattern'):
+        restored.validate('AB')
+
+
+def test_string_field_subclass_pickle_round_trip():
+    field = pickle.loads(pickle.dumps(_named(EmailField())))
+
+    assert field.validate('a@example.com') == 'a@example.com'
+
+
+def test_string_field_constraint_changes_after_construction():
+    field = _named(StringField(max_length=5))
+    field.validate('abcde')
+
+    field.max_length = 2
+    with pytest.raises(ValueError, match='too long'):
+        field.validate('abc')
+
+    field.max_length = None
+    field.min_length = 4
+    with pytest.raises(ValueError, match='too short'):
+        field.validate('abc')
+
+    field.min_length = None
+    field.regex = re.compile(r'^\d+$')
+    with pytest.raises(ValueError, match='does not match pattern'):
+        field.validate('abc')
+
+    field.regex = None
+    field.choices = ['x']
+    with pytest.raises(ValueError, match='not a valid choice'):
+        field.validate('abc')
+    assert field.validate('x') == 'x'
+
+
+def test_string_fields_keep_their_own_regex_matches():
+    first = _named(StringField(regex=r'^[a-z]+$'))
+    second = _named(StringField(regex=r'^[a-z]+$'))
+    first.validate('abc')
+    second.validate('xyz')
+
+    assert first._check_value.matched == {'abc'}
+    assert second._check_value.matched == {'xyz'}
+
+
+def test_string_field_rejects_non_strings():
+    with pytest.raises(TypeError):
+        _named(StringField()).validate(1)
+
+
+@pytest.mark.parametrize('cls', [NumberField, IntField, FloatField, DecimalField])
+def test_number_field_pickle_round_trip(cls):
+    field = _named(cls(min_value=1, max_value=10))
+
+    restored = pickle.loads(pickle.dumps(field))
+
+    assert restored.min_value == 1
+    assert restored.max_value == 10
+    restored.validate(5)
+    with pytest.raises(ValueError, match='too small'):
+        restored.validate(0)
+    with pytest.raises(ValueError, match='too large'):
+        restored.validate(11)
+
+
+def test_number_field_bound_changes_after_construction():
+    field = _named(IntField(max_value=10))
+    assert field.validate(10) == 10
+
+    field.max_value = 5
+    with pytest.raises(ValueError, match='too large'):
+        field.validate(10)
+
+    field.max_value = None
+    field.min_value = 20
+    with pytest.raises(ValueError, match='too small'):
+        field.validate(10)
+
+    field.min_value = None
+    assert field.validate(10) == 10
@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+
+from surrealengine.fields import BytesField, DecimalField, IPAddressField
+
+
+def _ip_field(**kwargs):
+    field = IPAddressField(**kwargs)
+    field.name = 'ip'
+    return field
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'ipv4_only': True}])
+@pytest.mark.parametrize('value', ['1.2.3.4', '0.0.0.0', '255.255.255.255'])
+def test_ip_address_field_accepts_ipv4(kwargs, value):
+    assert _ip_field(**kwargs).validate(value) == value
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'ipv4_only': True}])
+@pytest.mark.parametrize('value', [
+    '01.2.3.4',      # leading zero
+    '1.2.3.4\n',     # trailing newline
+    '256.1.1.1',
+    '1.2.3',
+])
+def test_ip_address_field_rejects_invalid_ipv4(kwargs, value):
+    with pytest.raises(ValueError, match='Invalid IP'):
+        _ip_field(**kwargs).validate(value)
+
+
+def test_ip_address_field_ipv4_only_rejects_ipv6():
+    assert _ip_field().validate('::1') == '::1'
+    with pytest.raises(ValueError, match='Invalid IPv4 address'):
+        _ip_field(ipv4_only=True).validate('::1')
+
+
+@pytest.mark.parametrize('data', [b'', b'abc', bytes(range(256))])
+def test_bytes_field_round_trip(data):
+    field = BytesField()
+    field.name = 'payload'
+
+    encoded = field.to_db(data)
+
+    assert encoded.startswith('<bytes>"')
+    assert field.from_db(encoded).getvalue() == data
+    assert [w.getvalue() for w in field.from_db_many([encoded, encoded])] == [data, data]
+
+
+def test_decimal_field_from_db_many_passes_bad_values_through():
+    field = DecimalField()
+    field.name = 'price'
+    values = ['1.5', 'abc', 2, None]
+
+    assert field.from_db_many(values) == [Decimal('1.5'), 'abc', Decimal(2), None]
+    assert field.from_db_many(values) == [field.from_db(value) for value in values]